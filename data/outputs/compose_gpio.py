@@ -4,6 +4,7 @@ import logging
 import argparse
 from pathlib import Path
 import json
+from functools import lru_cache
 
 # Add current directory to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -17,7 +18,19 @@ logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
 def parse_reference_header(filepath):
-    """Parses the reference gpio.h file."""
+    """
+    Parses the reference gpio.h file.
+
+    The parse is cached per path (generate_asrock_safe.py asks for the same
+    reference compose_state() already parsed); every caller gets its own copy
+    of the pad -> mode dict, so changing it can't affect later calls.
+    """
+    modes = _parse_reference_header(filepath)
+    return dict(modes) if modes is not None else None
+
+@lru_cache(maxsize=8)
+def _parse_reference_header(filepath):
+    """Parses the reference gpio.h file, shared by all callers (see parse_reference_header())"""
     import re
     modes = {}
     regex = re.compile(r'^\s*PAD_CFG_([A-Z0-9_]+)\s*\(([^,]+),')
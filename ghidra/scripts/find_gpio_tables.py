@@ -11,7 +11,10 @@
 # analyzeHeadless <project_dir> <project_name> \
 #   -import PchInitDxe.efi \
 #   -scriptPath . \
-#   -postScript find_gpio_tables.py <table_offsets_file>
+#   -postScript find_gpio_tables.py <output_json>
+#
+# The results are written to <output_json>, or to
+# /tmp/ghidra_gpio_analysis.json when no argument is given.
 
 from ghidra.program.model.symbol import SymbolType
 from ghidra.program.model.mem import MemoryAccessException
@@ -170,7 +173,8 @@ def main():
 
     # Also save to file if possible
     try:
-        output_file = "/tmp/ghidra_gpio_analysis.json"
+        script_args = getScriptArgs()
+        output_file = script_args[0] if script_args else "/tmp/ghidra_gpio_analysis.json"
         with open(output_file, 'w') as f:
             json.dump(results, f, indent=2)
         print("\n[*] Results saved to {0}".format(output_file))
@@ -5,16 +5,61 @@
 GPIO table detection module.
 """
 
-import struct
 import logging
+import mmap
+import os
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-from ..platforms.alderlake import GPIO_GROUPS, AlderLakeGpioPadConfig, ALDERLAKE_GPIO_SIGNATURE
+from typing import List, Dict, Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from ..platforms.alderlake import (
+    GPIO_GROUPS,
+    AlderLakeGpioPadConfig,
+    ALDERLAKE_GPIO_SIGNATURE,
+    ALDERLAKE_GPIO_SIGNATURE_DW0,
+    ALDERLAKE_GPIO_SIGNATURE_MASK,
+    validate_table,
+)
 
 
 logger = logging.getLogger(__name__)
 
 
+class _ScanCtx(NamedTuple):
+    """Views of one buffer shared by all scan strategies of a scan_for_tables call"""
+    data: bytes
+    u32: np.ndarray    # Little-endian dword at every 4-byte aligned offset
+    valid: np.ndarray  # validate() of the entry whose DW0 is at each dword
+
+    @classmethod
+    def from_data(cls, data: bytes) -> '_ScanCtx':
+        u32 = np.frombuffer(data, dtype='<u4', count=len(data) // 4)
+        # The last dword has no DW1 after it, so it can't start an entry
+        valid = np.zeros(len(u32), dtype=bool)
+        valid[:-1] = validate_table(u32[:-1], u32[1:])
+        return cls(data, u32, valid)
+
+    def valid_runs(self, step: int) -> np.ndarray:
+        """
+        Number of consecutive valid entries, step dwords apart, starting at
+        every dword. One pass per residue class instead of validating each
+        probe position of a scan separately.
+        """
+        runs = np.empty(len(self.valid), dtype=np.int64)
+        for residue in range(step):
+            valid = self.valid[residue::step]
+            pos = np.arange(len(valid))
+            # Index of the first invalid entry at or after each position
+            next_invalid = np.where(valid, len(valid), pos)
+            next_invalid = np.minimum.accumulate(next_invalid[::-1])[::-1]
+            runs[residue::step] = next_invalid - pos
+        return runs
+
+
 class GPIOTableDetector:
     def __init__(self, platform='alderlake'):
         """
@@ -25,6 +70,9 @@ class GPIOTableDetector:
         """
         self.platform = platform
 
+        # Shared views of the buffer being scanned, only set during scan_for_tables
+        self._ctx: Optional[_ScanCtx] = None
+
         # Platform-specific configuration
         if platform == 'alderlake':
             self.gpio_groups = GPIO_GROUPS
@@ -36,6 +84,8 @@ class GPIOTableDetector:
             # 20 bytes: Extended format (rare)
             self.expected_entry_sizes = [8, 12, 16, 20]
             self.signature = ALDERLAKE_GPIO_SIGNATURE
+            self.signature_dw0 = ALDERLAKE_GPIO_SIGNATURE_DW0
+            self.signature_mask = ALDERLAKE_GPIO_SIGNATURE_MASK
         else:
             raise ValueError(f"Unsupported platform: {platform}")
 
@@ -43,70 +93,67 @@ class GPIOTableDetector:
         tables = []
         if not self.signature: return []
 
+        ctx = self._ctx
+        if ctx is None or ctx.data is not data:
+            ctx = _ScanCtx.from_data(data)
+
         data_len = len(data)
         sig_len = len(self.signature)
         stride = entry_size
 
         # Issue #6 Fix: Use entry_size stride instead of hardcoded 4 for efficiency
         # Reduces iterations by 3-4x when entry_size > 4 (typical: 8, 12, 16 bytes)
-        for offset in range(0, data_len - (stride * sig_len), stride):
-            match = True
-            for i, expected in enumerate(self.signature):
-                try:
-                    p_off = offset + i * stride
-                    dw0 = struct.unpack('<I', data[p_off:p_off+4])[0]
-                    mode = (dw0 >> 10) & 0xF
-                    # Issue #3 Fix: Validate both mode AND reset field for tighter matching
-                    reset = (dw0 >> 30) & 0x3
-                    if mode != expected['mode'] or reset != expected['reset']:
-                        match = False
-                        break
-                except:
-                    match = False
-                    break
-
-            if match:
-                logger.info(f"SIGNATURE MATCH at offset 0x{offset:x} (entry size {entry_size})")
-                current_offset = offset
-                entries = []
-                invalid_streak = 0
-
-                # Cap at 320. Z690 is ~250-280.
-                while current_offset + entry_size <= data_len and len(entries) < 320:
-                    entry_data = data[current_offset:current_offset + entry_size]
-                    pad_config = self.pad_config_class(entry_data)
-
-                    if self._is_valid_pad_config(pad_config):
-                        entries.append({
-                            'offset': current_offset,
-                            'config': pad_config
-                        })
-                        current_offset += entry_size
-                        invalid_streak = 0
-                    else:
-                        invalid_streak += 1
-                        if invalid_streak > 2: break
-                        current_offset += entry_size
-
-                logger.info(f"  -> Extracted {len(entries)} entries")
-
-                # Only keep tables that look like full GPIO configs (>100 pads)
-                # or reasonably large fragments (>20)
-                if len(entries) >= 20:
-                    # Check if this is a VGPIO table
-                    is_vgpio = self._is_vgpio_table(entries)
+        # All candidate offsets are dword aligned, so the signature is checked
+        # for every candidate at once on the shared dword view.
+        # Issue #3 Fix: Validate both mode AND reset field for tighter matching
+        # (both are covered by the precompiled signature mask)
+        starts = np.arange(0, max(data_len - (stride * sig_len), 0), stride) // 4
+        match = np.ones(len(starts), dtype=bool)
+        for i, expected_dw0 in enumerate(self.signature_dw0):
+            idx = starts + i * (stride // 4)
+            match &= (ctx.u32[idx] & self.signature_mask) == expected_dw0
+
+        for offset in (np.flatnonzero(match) * stride).tolist():
+            logger.info(f"SIGNATURE MATCH at offset 0x{offset:x} (entry size {entry_size})")
+            current_offset = offset
+            entries = []
+            invalid_streak = 0
+
+            # Cap at 320. Z690 is ~250-280.
+            while current_offset + entry_size <= data_len and len(entries) < 320:
+                pad_config = self.pad_config_class.from_buffer(data, current_offset, entry_size)
+
+                if pad_config is not None and ctx.valid[current_offset // 4]:
+                    entries.append({
+                        'offset': current_offset,
+                        'config': pad_config
+                    })
+                    current_offset += entry_size
+                    invalid_streak = 0
+                else:
+                    invalid_streak += 1
+                    if invalid_streak > 2: break
+                    current_offset += entry_size
+
+            logger.info(f"  -> Extracted {len(entries)} entries")
+
+            # Only keep tables that look like full GPIO configs (>100 pads)
+            # or reasonably large fragments (>20)
+            if len(entries) >= 20:
+                # Check if this is a VGPIO table
+                is_vgpio = self._is_vgpio_table(entries)
 
-                    table_info = {
-                        'offset': offset,
-                        'entry_size': entry_size,
-                        'entry_count': len(entries),
-                        'total_size': len(entries) * entry_size,
-                        'entries': entries,
-                        'confidence': 100.0,
-                        'is_signature_match': True,
-                        'is_vgpio': is_vgpio
-                    }
-                    tables.append(table_info)
+                table_info = {
+                    'offset': offset,
+                    'entry_size': entry_size,
+                    'entry_count': len(entries),
+                    'total_size': len(entries) * entry_size,
+                    'entries': entries,
+                    'confidence': 100.0,
+                    'is_signature_match': True,
+                    'is_vgpio': is_vgpio
+                }
+                tables.append(table_info)
 
         return tables
 
@@ -116,11 +163,18 @@ class GPIOTableDetector:
 
         Returns both signature-matched standard GPIO tables and VGPIO tables.
         """
+        self._ctx = _ScanCtx.from_data(data)
+        try:
+            return self._scan_for_tables(self._ctx, min_entries)
+        finally:
+            self._ctx = None
+
+    def _scan_for_tables(self, ctx: _ScanCtx, min_entries: int) -> List[Dict]:
         all_tables = []
 
         # Strategy 1: Signature matching for standard GPIOs (8-byte stride)
         for entry_size in [8, 12, 16]:
-            sig_tables = self.scan_for_signature(data, entry_size)
+            sig_tables = self.scan_for_signature(ctx.data, entry_size)
             if sig_tables:
                 logger.info(f"Found {len(sig_tables)} tables via signature matching (stride {entry_size})")
                 all_tables.extend(sig_tables)
@@ -136,7 +190,7 @@ class GPIOTableDetector:
 
             # Targeted scan for VGPIOs only (10-100 entries)
             for entry_size in [12, 16]:
-                vgpio_candidates = self._scan_for_vgpios(data, entry_size, min_entries=10, max_entries=100)
+                vgpio_candidates = self._scan_for_vgpios(ctx, entry_size, min_entries=10, max_entries=100)
                 for table in vgpio_candidates:
                     is_duplicate = any(
                         t['offset'] == table['offset'] and t['entry_size'] == table['entry_size']
@@ -152,7 +206,7 @@ class GPIOTableDetector:
         # Only scan if we didn't find large tables via signature matching
         logger.info("Running full pattern scan to find tables...")
         for entry_size in self.expected_entry_sizes:
-            detected = self._scan_fixed_size_entries(data, entry_size, min_entries)
+            detected = self._scan_fixed_size_entries(ctx, entry_size, min_entries)
             # Filter out duplicates (tables at same offset)
             for table in detected:
                 is_duplicate = any(
@@ -164,9 +218,10 @@ class GPIOTableDetector:
 
         return all_tables
 
-    def _scan_fixed_size_entries(self, data: bytes, entry_size: int, min_entries: int) -> List[Dict]:
+    def _scan_fixed_size_entries(self, ctx: _ScanCtx, entry_size: int, min_entries: int) -> List[Dict]:
         """Scan for fixed-size GPIO table entries"""
         tables = []
+        data = ctx.data
         data_len = len(data)
         offset = 0
 
@@ -174,27 +229,20 @@ class GPIOTableDetector:
         # Skip large scans if we're looking for VGPIOs
         max_scan_entries = 350
 
-        while offset < data_len - (entry_size * min_entries):
-            valid_count = 0
-            current_offset = offset
-            entries = []
+        # Offsets stay multiples of entry_size, only the ones starting at least
+        # min_entries valid entries can yield a table
+        step = entry_size // 4
+        runs = ctx.valid_runs(step)
+        candidates = (np.flatnonzero(runs[::step] >= min_entries) * entry_size).tolist()
 
-            while current_offset + entry_size <= data_len and valid_count < max_scan_entries:
-                try:
-                    if entry_size >= 8:
-                        pad_config = self.pad_config_class(data[current_offset:current_offset + entry_size])
-                        if self._is_valid_pad_config(pad_config):
-                            valid_count += 1
-                            entries.append({'offset': current_offset, 'config': pad_config})
-                            current_offset += entry_size
-                        else:
-                            break
-                    else:
-                        break
-                except:
-                    break
+        while offset < data_len - (entry_size * min_entries):
+            valid_count = min(int(runs[offset // 4]), max_scan_entries,
+                              (data_len - offset) // entry_size)
+            current_offset = offset + valid_count * entry_size
 
             if valid_count >= min_entries and valid_count < max_scan_entries:
+                entries = self._extract_entries(data, offset, entry_size, valid_count)
+
                 # Check if this is a VGPIO table
                 is_vgpio = self._is_vgpio_table(entries)
 
@@ -225,11 +273,14 @@ class GPIOTableDetector:
                 # Compromise: If we found 0 valid entries, skip by entry_size.
                 # If we found some valid entries but not enough (partial match), maybe skip less?
                 # For now, simple optimization:
-                offset += entry_size
+                i = bisect_right(candidates, offset)
+                if i == len(candidates):
+                    break
+                offset = candidates[i]
 
         return tables
 
-    def _scan_for_vgpios(self, data: bytes, entry_size: int, min_entries: int, max_entries: int) -> List[Dict]:
+    def _scan_for_vgpios(self, ctx: _ScanCtx, entry_size: int, min_entries: int, max_entries: int) -> List[Dict]:
         """
         Targeted scan for VGPIO tables only.
 
@@ -237,7 +288,7 @@ class GPIOTableDetector:
         to filter out false positives. This is much faster than the full pattern scan.
 
         Args:
-            data: Binary data to scan
+            ctx: Scan context of the binary data to scan
             entry_size: Size of each entry (12 or 16 bytes for VGPIOs)
             min_entries: Minimum number of entries to consider
             max_entries: Maximum number of entries to consider
@@ -246,29 +297,24 @@ class GPIOTableDetector:
             List of VGPIO table dictionaries
         """
         tables = []
+        data = ctx.data
         data_len = len(data)
         offset = 0
 
-        while offset < data_len - (entry_size * min_entries):
-            valid_count = 0
-            current_offset = offset
-            entries = []
+        runs = ctx.valid_runs(entry_size // 4)
+        # Dword offsets starting at least min_entries valid entries, the only
+        # ones worth probing
+        candidates = (np.flatnonzero(runs >= min_entries) * 4).tolist()
 
-            # Scan for consecutive valid entries, but stop at max_entries
-            while current_offset + entry_size <= data_len and valid_count < max_entries:
-                try:
-                    pad_config = self.pad_config_class(data[current_offset:current_offset + entry_size])
-                    if self._is_valid_pad_config(pad_config):
-                        valid_count += 1
-                        entries.append({'offset': current_offset, 'config': pad_config})
-                        current_offset += entry_size
-                    else:
-                        break
-                except:
-                    break
+        while offset < data_len - (entry_size * min_entries):
+            # Count consecutive valid entries, but stop at max_entries
+            valid_count = min(int(runs[offset // 4]), max_entries,
+                              (data_len - offset) // entry_size)
+            current_offset = offset + valid_count * entry_size
 
             # Only keep if it's VGPIO-sized and passes VGPIO heuristic
             if min_entries <= valid_count <= max_entries:
+                entries = self._extract_entries(data, offset, entry_size, valid_count)
                 is_vgpio = self._is_vgpio_table(entries)
 
                 if is_vgpio:
@@ -286,14 +332,21 @@ class GPIOTableDetector:
 
                 offset = current_offset
             else:
-                offset += 4
+                i = bisect_right(candidates, offset)
+                if i == len(candidates):
+                    break
+                offset = candidates[i]
 
         return tables
 
 
-    def _is_valid_pad_config(self, config: AlderLakeGpioPadConfig) -> bool:
-        """Check if a pad config looks valid"""
-        return config.validate()
+    def _extract_entries(self, data: bytes, offset: int, entry_size: int,
+                         count: int) -> List[Dict]:
+        """Build the entries of a table already known to hold count valid pads"""
+        configs = self.pad_config_class.from_table(data, offset, entry_size, count)
+        return [{'offset': entry_offset, 'config': config}
+                for entry_offset, config in zip(range(offset, offset + count * entry_size, entry_size),
+                                                configs)]
 
     def _is_vgpio_table(self, entries: List[Dict]) -> bool:
         """
@@ -315,23 +368,15 @@ class GPIOTableDetector:
         size_match = any(abs(entry_count - size) <= 2 for size in vgpio_sizes)
 
         # Check characteristics of first few entries
-        nafvwe_count = 0
-        deep_reset_count = 0
-
-        for entry in entries[:min(10, len(entries))]:
-            config = entry['config']
-
-            # Check for NAFVWE bit (DW0[27])
-            if config.dw0 & (1 << 27):
-                nafvwe_count += 1
+        sample_size = min(10, len(entries))
+        dw0s = np.fromiter((entry['config'].dw0 for entry in entries[:sample_size]),
+                           dtype=np.uint32, count=sample_size)
 
-            # Check for DEEP reset (0b01 in DW0[31:30])
-            reset_val = (config.dw0 >> 30) & 0x3
-            if reset_val == 0b01:
-                deep_reset_count += 1
+        # NAFVWE bit (DW0[27]) and DEEP reset (0b01 in DW0[31:30])
+        nafvwe_count = int(((dw0s >> 27) & 1).sum())
+        deep_reset_count = int((((dw0s >> 30) & 0x3) == 0b01).sum())
 
         # If most entries have NAFVWE or DEEP reset, likely VGPIO
-        sample_size = min(10, len(entries))
         nafvwe_ratio = nafvwe_count / sample_size if sample_size > 0 else 0
         deep_ratio = deep_reset_count / sample_size if sample_size > 0 else 0
 
@@ -385,10 +430,53 @@ class GPIOTableDetector:
 
     def scan_file(self, file_path: Path, min_entries: int = 10) -> List[Dict]:
         try:
-            with open(file_path, 'rb') as f: data = f.read()
-            tables = self.scan_for_tables(data, min_entries)
+            with open(file_path, 'rb') as f:
+                # Scan a read-only mapping instead of a private copy of the
+                # image (mmap can't map an empty file)
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size == 0:
+                    tables = self.scan_for_tables(b'', min_entries)
+                else:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        tables = self.scan_for_tables(data, min_entries)
+                    finally:
+                        try:
+                            data.close()
+                        except BufferError:
+                            # The traceback of a failed scan still holds views
+                            # into the mapping; let the scan's error through,
+                            # the mapping goes away with the last view
+                            pass
             for table in tables:
                 table['file'] = str(file_path)
-                table['file_size'] = len(data)
+                table['file_size'] = file_size
             return tables
-        except: return []
+        except OSError as e:
+            logger.warning(f"Could not read {file_path}: {e}")
+            return []
+
+    def scan_files(self, file_paths: List[Path], min_entries: int = 10,
+                   workers: Optional[int] = None) -> Iterator[List[Dict]]:
+        """
+        Scan several files, yielding the tables of each file in input order.
+
+        Every file is scanned independently and the scan is CPU-bound, so the
+        files are spread over a process pool. A single file (or workers=1)
+        is scanned in-process to avoid the pool start-up cost.
+
+        Args:
+            file_paths: Files to scan
+            min_entries: Minimum entries for a table (see scan_file)
+            workers: Number of worker processes (None = CPU count)
+        """
+        file_paths = list(file_paths)
+        scan = partial(self.scan_file, min_entries=min_entries)
+
+        if len(file_paths) <= 1 or workers == 1:
+            for file_path in file_paths:
+                yield scan(file_path)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(scan, file_paths, chunksize=4)
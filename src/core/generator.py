@@ -10,7 +10,7 @@ Generates coreboot-compatible GPIO configuration files from parsed data.
 import logging
 from pathlib import Path
 from typing import List, Dict
-from platforms.alderlake import PadMode
+from ..platforms.alderlake import PadMode
 
 logger = logging.getLogger(__name__)
 
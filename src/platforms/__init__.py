@@ -6,23 +6,33 @@
 from .alderlake import (
     AlderLakeGpioPadConfig,
     GPIO_GROUPS,
+    COMMUNITIES,
+    ALL_PAD_NAMES,
     PadMode,
     PadDirection,
     PadPull,
     PadReset,
     get_pad_name,
     find_group_for_pad,
+    decode_table,
+    parse_pad_table,
+    validate_table,
     GPIO_MODULE_PATTERNS,
 )
 
 __all__ = [
     'AlderLakeGpioPadConfig',
     'GPIO_GROUPS',
+    'COMMUNITIES',
+    'ALL_PAD_NAMES',
     'PadMode',
     'PadDirection',
     'PadPull',
     'PadReset',
     'get_pad_name',
     'find_group_for_pad',
+    'decode_table',
+    'parse_pad_table',
+    'validate_table',
     'GPIO_MODULE_PATTERNS',
 ]
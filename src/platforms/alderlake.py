@@ -14,9 +14,89 @@ Based on:
 """
 
 import struct
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
 from typing import Dict, List, Tuple, Optional
 from enum import IntEnum
 
+import numpy as np
+
+# Public names, also what the top-level platforms/alderlake.py re-exports
+__all__ = [
+    'PadMode',
+    'PadDirection',
+    'PadPull',
+    'PadReset',
+    'PadTrigger',
+    'RxTxConfig',
+    'PadOwner',
+    'DW0_MASK',
+    'DW1_MASK',
+    'DW0_PADRST_CFG_SHIFT',
+    'DW0_PADRST_CFG_MASK',
+    'DW0_RXPADSTSEL_SHIFT',
+    'DW0_RXPADSTSEL_MASK',
+    'DW0_RXRAW1_SHIFT',
+    'DW0_RXRAW1_MASK',
+    'DW0_RXEVCFG_SHIFT',
+    'DW0_RXEVCFG_MASK',
+    'DW0_PREGFRXSEL_SHIFT',
+    'DW0_PREGFRXSEL_MASK',
+    'DW0_RXINV_SHIFT',
+    'DW0_RXINV_MASK',
+    'DW0_RXTXENCFG_SHIFT',
+    'DW0_RXTXENCFG_MASK',
+    'DW0_GPIROUTIOXAPIC_SHIFT',
+    'DW0_GPIROUTIOXAPIC_MASK',
+    'DW0_GPIROUTSCI_SHIFT',
+    'DW0_GPIROUTSCI_MASK',
+    'DW0_GPIROUTSMI_SHIFT',
+    'DW0_GPIROUTSMI_MASK',
+    'DW0_GPIROUTNMI_SHIFT',
+    'DW0_GPIROUTNMI_MASK',
+    'DW0_GPIROUT_MASK',
+    'DW0_PMODE_SHIFT',
+    'DW0_PMODE_MASK',
+    'DW0_GPIORXTXDIS_SHIFT',
+    'DW0_GPIORXTXDIS_MASK',
+    'DW0_GPIORXSTATE_SHIFT',
+    'DW0_GPIORXSTATE_MASK',
+    'DW0_GPIOTXSTATE_SHIFT',
+    'DW0_GPIOTXSTATE_MASK',
+    'DW1_PADTOL_SHIFT',
+    'DW1_PADTOL_MASK',
+    'DW1_IOSTANDBY_SHIFT',
+    'DW1_IOSTANDBY_MASK',
+    'DW1_TERM_SHIFT',
+    'DW1_TERM_MASK',
+    'DW1_IOSTANDBYTERM_SHIFT',
+    'DW1_IOSTANDBYTERM_MASK',
+    'DW1_INTSEL_SHIFT',
+    'DW1_INTSEL_MASK',
+    'GPIO_GROUPS',
+    'ALDERLAKE_S_GROUPS_ORDER',
+    'ALDERLAKE_GPIO_SIGNATURE',
+    'ALDERLAKE_GPIO_SIGNATURE_MASK',
+    'ALDERLAKE_GPIO_SIGNATURE_DW0',
+    'AlderLakeGpioPadConfig',
+    'decode_modes',
+    'decode_resets',
+    'decode_rxtx',
+    'decode_triggers',
+    'decode_terms',
+    'decode_table',
+    'validate_table',
+    'parse_pad_table',
+    'get_pad_name',
+    'resolve_global_pad_name',
+    'find_group_for_pad',
+    'COMMUNITIES',
+    'ALL_PAD_NAMES',
+    'GPIO_MODULE_PATTERNS',
+    'KNOWN_FSP_GUIDS',
+]
+
 
 class PadMode(IntEnum):
     """GPIO pad mode selection"""
@@ -79,11 +159,110 @@ class PadOwner(IntEnum):
     GPIO_DRIVER = 1
 
 
+# Raw field value -> enum member, indexed by the masked bitfield. Values
+# without a member map to the fallback the accessors have always returned.
+_PAD_MODE_BY_VALUE = tuple(PadMode(v) if v < 8 else PadMode.GPIO for v in range(16))
+_PAD_PULL_BY_VALUE = tuple(PadPull(v) if v in PadPull._value2member_map_ else PadPull.NONE
+                           for v in range(16))
+_PAD_RESET_BY_VALUE = tuple(PadReset(v) for v in range(4))
+_PAD_TRIGGER_BY_VALUE = tuple(PadTrigger(v) for v in range(4))
+_RXTX_CONFIG_BY_VALUE = tuple(RxTxConfig(v) for v in range(4))
+
+# Direction by raw RX/TX field: only TX enabled + RX disabled is an output,
+# anything else is treated as input (or bidirectional)
+_DIRECTION_BY_RXTX = tuple(PadDirection.OUTPUT if v == RxTxConfig.RX_DISABLE else PadDirection.INPUT
+                           for v in range(4))
+_DIRECTION_BY_RXTX_ARRAY = np.array(_DIRECTION_BY_RXTX, dtype=np.uint8)
+
+# Same tables resolved to member names, for to_dict()
+_PAD_MODE_NAMES = tuple(m.name for m in _PAD_MODE_BY_VALUE)
+_PAD_PULL_NAMES = tuple(p.name for p in _PAD_PULL_BY_VALUE)
+_PAD_RESET_NAMES = tuple(r.name for r in _PAD_RESET_BY_VALUE)
+_PAD_TRIGGER_NAMES = tuple(t.name for t in _PAD_TRIGGER_BY_VALUE)
+
+
 # Alder Lake DW0/DW1 Masks (from intelp2m)
 # These define which bits are valid/used in each register
 DW0_MASK = (0b1 << 27) | (0b1 << 24) | (0b11 << 21) | (0b1111 << 16) | 0b11111100
 DW1_MASK = 0xFDFFC3FF
 
+# Pre-compiled layouts of a pad config entry: DW0+DW1, and DW0..DW3
+_PAD8 = struct.Struct('<II')
+_PAD16 = struct.Struct('<IIII')
+
+# DW0 bit definitions (based on Intel PCH datasheet + intelp2m)
+# Module level so the accessors don't pay a class attribute lookup per field
+DW0_PADRST_CFG_SHIFT = 30
+DW0_PADRST_CFG_MASK = 0x3 << DW0_PADRST_CFG_SHIFT
+
+DW0_RXPADSTSEL_SHIFT = 29
+DW0_RXPADSTSEL_MASK = 0x1 << DW0_RXPADSTSEL_SHIFT
+
+DW0_RXRAW1_SHIFT = 28
+DW0_RXRAW1_MASK = 0x1 << DW0_RXRAW1_SHIFT
+
+DW0_RXEVCFG_SHIFT = 25
+DW0_RXEVCFG_MASK = 0x3 << DW0_RXEVCFG_SHIFT
+
+DW0_PREGFRXSEL_SHIFT = 24
+DW0_PREGFRXSEL_MASK = 0x1 << DW0_PREGFRXSEL_SHIFT
+
+DW0_RXINV_SHIFT = 23
+DW0_RXINV_MASK = 0x1 << DW0_RXINV_SHIFT
+
+DW0_RXTXENCFG_SHIFT = 21
+DW0_RXTXENCFG_MASK = 0x3 << DW0_RXTXENCFG_SHIFT
+
+DW0_GPIROUTIOXAPIC_SHIFT = 20
+DW0_GPIROUTIOXAPIC_MASK = 0x1 << DW0_GPIROUTIOXAPIC_SHIFT
+
+DW0_GPIROUTSCI_SHIFT = 19
+DW0_GPIROUTSCI_MASK = 0x1 << DW0_GPIROUTSCI_SHIFT
+
+DW0_GPIROUTSMI_SHIFT = 18
+DW0_GPIROUTSMI_MASK = 0x1 << DW0_GPIROUTSMI_SHIFT
+
+DW0_GPIROUTNMI_SHIFT = 17
+DW0_GPIROUTNMI_MASK = 0x1 << DW0_GPIROUTNMI_SHIFT
+
+# All four interrupt routes DW0[20:17], and the reported route for each
+# combination of them (APIC > SCI > SMI > NMI)
+DW0_GPIROUT_MASK = (DW0_GPIROUTIOXAPIC_MASK | DW0_GPIROUTSCI_MASK |
+                    DW0_GPIROUTSMI_MASK | DW0_GPIROUTNMI_MASK)
+_INTERRUPT_TYPE_BY_ROUTE = tuple(
+    'APIC' if v & 0b1000 else 'SCI' if v & 0b0100 else
+    'SMI' if v & 0b0010 else 'NMI' if v & 0b0001 else 'NONE'
+    for v in range(16)
+)
+
+DW0_PMODE_SHIFT = 10
+DW0_PMODE_MASK = 0xF << DW0_PMODE_SHIFT  # 4 bits for mode (0-7 used)
+
+DW0_GPIORXTXDIS_SHIFT = 8
+DW0_GPIORXTXDIS_MASK = 0x3 << DW0_GPIORXTXDIS_SHIFT
+
+DW0_GPIORXSTATE_SHIFT = 1
+DW0_GPIORXSTATE_MASK = 0x1 << DW0_GPIORXSTATE_SHIFT
+
+DW0_GPIOTXSTATE_SHIFT = 0
+DW0_GPIOTXSTATE_MASK = 0x1 << DW0_GPIOTXSTATE_SHIFT
+
+# DW1 bit definitions
+DW1_PADTOL_SHIFT = 25
+DW1_PADTOL_MASK = 0x1 << DW1_PADTOL_SHIFT
+
+DW1_IOSTANDBY_SHIFT = 14
+DW1_IOSTANDBY_MASK = 0xF << DW1_IOSTANDBY_SHIFT
+
+DW1_TERM_SHIFT = 10
+DW1_TERM_MASK = 0xF << DW1_TERM_SHIFT
+
+DW1_IOSTANDBYTERM_SHIFT = 8
+DW1_IOSTANDBYTERM_MASK = 0x3 << DW1_IOSTANDBYTERM_SHIFT
+
+DW1_INTSEL_SHIFT = 0
+DW1_INTSEL_MASK = 0xFF << DW1_INTSEL_SHIFT
+
 
 # GPIO Community and Group definitions for Alder Lake PCH-P/M/S
 # Based on Intel Alder Lake PCH datasheet
@@ -119,6 +298,19 @@ GPIO_GROUPS = {
     'GPP_D': {'community': 5, 'group': 0, 'pad_start': 0, 'pad_count': 24},
 }
 
+# Per community: sorted group start pads, and (pad_start, pad_end, group_name)
+# rows in the same order, for bisecting a community-local pad number
+def _build_community_groups() -> Dict[int, Tuple[List[int], List[Tuple[int, int, str]]]]:
+    by_community = {}
+    for name, info in sorted(GPIO_GROUPS.items(), key=lambda g: g[1]['pad_start']):
+        starts, rows = by_community.setdefault(info['community'], ([], []))
+        starts.append(info['pad_start'])
+        rows.append((info['pad_start'], info['pad_start'] + info['pad_count'], name))
+    return by_community
+
+
+_COMMUNITY_GROUPS = _build_community_groups()
+
 # Order of Physical GPIO Groups in the monolithic BIOS table
 # Virtual groups (VGPIO*) are excluded as they are not present in the 8-byte config table.
 ALDERLAKE_S_GROUPS_ORDER = [
@@ -149,6 +341,11 @@ ALDERLAKE_S_GROUPS_ORDER = [
     ('GPP_D', 24),
 ]
 
+# Start index of every group of ALDERLAKE_S_GROUPS_ORDER in the global table,
+# plus the total pad count, for bisecting global indices
+_GROUP_ORDER_NAMES = [name for name, _ in ALDERLAKE_S_GROUPS_ORDER]
+_GROUP_ORDER_STARTS = [0, *accumulate(count for _, count in ALDERLAKE_S_GROUPS_ORDER)]
+
 # Signature for Z690/Alder Lake GPIO Table (Start of GPP_I)
 # GPP_I0: GPIO, GPP_I1-I4: NF1 (DDSP_HPD)
 ALDERLAKE_GPIO_SIGNATURE = [
@@ -159,6 +356,15 @@ ALDERLAKE_GPIO_SIGNATURE = [
     {'mode': 1, 'reset': 2}, # GPP_I4
 ]
 
+# The signature precompiled to DW0 compare values under one mask covering
+# the pad mode DW0[13:10] and reset config DW0[31:30] fields
+ALDERLAKE_GPIO_SIGNATURE_MASK = DW0_PADRST_CFG_MASK | DW0_PMODE_MASK
+ALDERLAKE_GPIO_SIGNATURE_DW0 = np.array(
+    [(e['reset'] << DW0_PADRST_CFG_SHIFT) | (e['mode'] << DW0_PMODE_SHIFT)
+     for e in ALDERLAKE_GPIO_SIGNATURE],
+    dtype=np.uint32,
+)
+
 
 class AlderLakeGpioPadConfig:
     """
@@ -172,67 +378,8 @@ class AlderLakeGpioPadConfig:
     Bitfield definitions based on Intel Alder Lake PCH datasheet and intelp2m.
     """
 
-    # DW0 bit definitions (based on Intel PCH datasheet + intelp2m)
-    DW0_PADRST_CFG_SHIFT = 30
-    DW0_PADRST_CFG_MASK = 0x3 << DW0_PADRST_CFG_SHIFT
-
-    DW0_RXPADSTSEL_SHIFT = 29
-    DW0_RXPADSTSEL_MASK = 0x1 << DW0_RXPADSTSEL_SHIFT
-
-    DW0_RXRAW1_SHIFT = 28
-    DW0_RXRAW1_MASK = 0x1 << DW0_RXRAW1_SHIFT
-
-    DW0_RXEVCFG_SHIFT = 25
-    DW0_RXEVCFG_MASK = 0x3 << DW0_RXEVCFG_SHIFT
-
-    DW0_PREGFRXSEL_SHIFT = 24
-    DW0_PREGFRXSEL_MASK = 0x1 << DW0_PREGFRXSEL_SHIFT
-
-    DW0_RXINV_SHIFT = 23
-    DW0_RXINV_MASK = 0x1 << DW0_RXINV_SHIFT
-
-    DW0_RXTXENCFG_SHIFT = 21
-    DW0_RXTXENCFG_MASK = 0x3 << DW0_RXTXENCFG_SHIFT
-
-    DW0_GPIROUTIOXAPIC_SHIFT = 20
-    DW0_GPIROUTIOXAPIC_MASK = 0x1 << DW0_GPIROUTIOXAPIC_SHIFT
-
-    DW0_GPIROUTSCI_SHIFT = 19
-    DW0_GPIROUTSCI_MASK = 0x1 << DW0_GPIROUTSCI_SHIFT
-
-    DW0_GPIROUTSMI_SHIFT = 18
-    DW0_GPIROUTSMI_MASK = 0x1 << DW0_GPIROUTSMI_SHIFT
-
-    DW0_GPIROUTNMI_SHIFT = 17
-    DW0_GPIROUTNMI_MASK = 0x1 << DW0_GPIROUTNMI_SHIFT
-
-    DW0_PMODE_SHIFT = 10
-    DW0_PMODE_MASK = 0xF << DW0_PMODE_SHIFT  # 4 bits for mode (0-7 used)
-
-    DW0_GPIORXTXDIS_SHIFT = 8
-    DW0_GPIORXTXDIS_MASK = 0x3 << DW0_GPIORXTXDIS_SHIFT
-
-    DW0_GPIORXSTATE_SHIFT = 1
-    DW0_GPIORXSTATE_MASK = 0x1 << DW0_GPIORXSTATE_SHIFT
-
-    DW0_GPIOTXSTATE_SHIFT = 0
-    DW0_GPIOTXSTATE_MASK = 0x1 << DW0_GPIOTXSTATE_SHIFT
-
-    # DW1 bit definitions
-    DW1_PADTOL_SHIFT = 25
-    DW1_PADTOL_MASK = 0x1 << DW1_PADTOL_SHIFT
-
-    DW1_IOSTANDBY_SHIFT = 14
-    DW1_IOSTANDBY_MASK = 0xF << DW1_IOSTANDBY_SHIFT
-
-    DW1_TERM_SHIFT = 10
-    DW1_TERM_MASK = 0xF << DW1_TERM_SHIFT
-
-    DW1_IOSTANDBYTERM_SHIFT = 8
-    DW1_IOSTANDBYTERM_MASK = 0x3 << DW1_IOSTANDBYTERM_SHIFT
-
-    DW1_INTSEL_SHIFT = 0
-    DW1_INTSEL_MASK = 0xFF << DW1_INTSEL_SHIFT
+    # One instance per scanned entry: no per-instance __dict__
+    __slots__ = ('dw0', 'dw1', 'dw2', 'dw3')
 
     def __init__(self, raw_bytes: bytes, offset: int = 0):
         """
@@ -245,94 +392,132 @@ class AlderLakeGpioPadConfig:
         if len(raw_bytes) < offset + 8:
             raise ValueError("Insufficient data for GPIO pad config")
 
-        # Most vendor BIOS tables store at minimum DW0 and DW1
-        self.dw0 = struct.unpack('<I', raw_bytes[offset:offset+4])[0]
-        self.dw1 = struct.unpack('<I', raw_bytes[offset+4:offset+8])[0]
-
+        # Most vendor BIOS tables store at minimum DW0 and DW1,
         # DW2/DW3 may be present in some implementations
-        self.dw2 = 0
-        self.dw3 = 0
         if len(raw_bytes) >= offset + 16:
-            self.dw2 = struct.unpack('<I', raw_bytes[offset+8:offset+12])[0]
-            self.dw3 = struct.unpack('<I', raw_bytes[offset+12:offset+16])[0]
+            self.dw0, self.dw1, self.dw2, self.dw3 = _PAD16.unpack_from(raw_bytes, offset)
+        else:
+            self.dw0, self.dw1 = _PAD8.unpack_from(raw_bytes, offset)
+            self.dw2 = 0
+            self.dw3 = 0
+
+    @classmethod
+    def from_buffer(cls, buf, offset: int = 0,
+                    size: int = 16) -> Optional['AlderLakeGpioPadConfig']:
+        """
+        Parse the pad config entry of `size` bytes at `offset` without copying it.
+
+        Unlike the constructor this does not raise on short data; it returns
+        None instead, which keeps failure-dominated scan loops cheap.
+
+        Args:
+            buf: Buffer (bytes, memoryview, mmap) containing the entry
+            offset: Offset of the entry in buf
+            size: Entry size; DW2/DW3 are only read if they fit in the entry
+        """
+        end = min(len(buf), offset + size)
+        if end < offset + 8:
+            return None
+
+        config = cls.__new__(cls)
+        if end >= offset + 16:
+            config.dw0, config.dw1, config.dw2, config.dw3 = _PAD16.unpack_from(buf, offset)
+        else:
+            config.dw0, config.dw1 = _PAD8.unpack_from(buf, offset)
+            config.dw2 = 0
+            config.dw3 = 0
+        return config
+
+    @classmethod
+    def from_words(cls, dw0: int, dw1: int, dw2: int = 0,
+                   dw3: int = 0) -> 'AlderLakeGpioPadConfig':
+        """Build a pad config from already decoded register words"""
+        config = cls.__new__(cls)
+        config.dw0 = dw0
+        config.dw1 = dw1
+        config.dw2 = dw2
+        config.dw3 = dw3
+        return config
+
+    @classmethod
+    def from_table(cls, raw_bytes, offset: int = 0, stride: int = 8,
+                   count: Optional[int] = None) -> List['AlderLakeGpioPadConfig']:
+        """
+        Parse a whole table of pad config entries at once.
+
+        Same configs as from_buffer() on each entry, but the words of all
+        entries are read by one parse_table() view instead of per entry.
+        """
+        words = cls.parse_table(raw_bytes, offset, stride, count)
+        # DW2/DW3 are only read from entries wide enough for both
+        words = words[:, :4] if stride >= 16 else words[:, :2]
+        from_words = cls.from_words
+        return [from_words(*row) for row in words.tolist()]
+
+    @staticmethod
+    def parse_table(raw_bytes, offset: int = 0, stride: int = 8,
+                    count: Optional[int] = None) -> np.ndarray:
+        """
+        Read a whole table of pad config entries with a single numpy view.
+
+        Args:
+            raw_bytes: Buffer containing the table
+            offset: Offset of the first entry in raw_bytes
+            stride: Entry size in bytes (a multiple of 4, at least 8)
+            count: Number of entries (default: as many as fit in raw_bytes)
+
+        Returns:
+            (count, stride // 4) uint32 array; column 0 is DW0, column 1 DW1,
+            further columns are DW2/DW3 for wider entries
+        """
+        if count is None:
+            count = (len(raw_bytes) - offset) // stride
+        words = np.frombuffer(raw_bytes, dtype='<u4', count=count * (stride // 4), offset=offset)
+        return words.reshape(count, stride // 4)
+
+    def _pad_mode_int(self) -> int:
+        """Raw pad mode nibble DW0[13:10] (values above 7 are invalid)"""
+        return (self.dw0 >> DW0_PMODE_SHIFT) & 0xF
 
     def get_pad_mode(self) -> PadMode:
         """Extract pad mode from DW0[12:10]"""
-        mode_val = (self.dw0 & self.DW0_PMODE_MASK) >> self.DW0_PMODE_SHIFT
-        try:
-            return PadMode(mode_val)
-        except ValueError:
-            return PadMode.GPIO
+        return _PAD_MODE_BY_VALUE[self._pad_mode_int()]
 
     def get_rxtx_config(self) -> RxTxConfig:
         """Extract RX/TX buffer configuration from DW0[9:8]"""
-        val = (self.dw0 & self.DW0_GPIORXTXDIS_MASK) >> self.DW0_GPIORXTXDIS_SHIFT
-        try:
-            return RxTxConfig(val)
-        except ValueError:
-            return RxTxConfig.TX_RX_ENABLE
+        return _RXTX_CONFIG_BY_VALUE[(self.dw0 >> DW0_GPIORXTXDIS_SHIFT) & 0x3]
 
     def get_direction(self) -> PadDirection:
         """Get GPIO direction (only meaningful in GPIO mode)"""
-        rxtx = self.get_rxtx_config()
-
-        # TX enabled, RX disabled = Output
-        if rxtx == RxTxConfig.RX_DISABLE:
-            return PadDirection.OUTPUT
-        # Otherwise input (or bidirectional, treat as input)
-        else:
-            return PadDirection.INPUT
+        return _DIRECTION_BY_RXTX[(self.dw0 >> DW0_GPIORXTXDIS_SHIFT) & 0x3]
 
     def get_output_value(self) -> int:
         """Get output value (0 or 1) for output pads"""
-        return 1 if (self.dw0 & self.DW0_GPIOTXSTATE_MASK) else 0
+        return 1 if (self.dw0 & DW0_GPIOTXSTATE_MASK) else 0
 
     def get_reset_config(self) -> PadReset:
         """Extract reset domain configuration from DW0[31:30]"""
-        reset_val = (self.dw0 & self.DW0_PADRST_CFG_MASK) >> self.DW0_PADRST_CFG_SHIFT
-        try:
-            return PadReset(reset_val)
-        except ValueError:
-            return PadReset.PLTRST
+        return _PAD_RESET_BY_VALUE[(self.dw0 >> DW0_PADRST_CFG_SHIFT) & 0x3]
 
     def get_termination(self) -> PadPull:
         """Extract termination/pull configuration from DW1[13:10]"""
-        term_val = (self.dw1 & self.DW1_TERM_MASK) >> self.DW1_TERM_SHIFT
-        try:
-            return PadPull(term_val)
-        except ValueError:
-            return PadPull.NONE
+        return _PAD_PULL_BY_VALUE[(self.dw1 >> DW1_TERM_SHIFT) & 0xF]
 
     def get_trigger_type(self) -> PadTrigger:
         """Extract interrupt trigger type from DW0[27:25]"""
-        trig_val = (self.dw0 & self.DW0_RXEVCFG_MASK) >> self.DW0_RXEVCFG_SHIFT
-        try:
-            return PadTrigger(trig_val)
-        except ValueError:
-            return PadTrigger.OFF
+        return _PAD_TRIGGER_BY_VALUE[(self.dw0 >> DW0_RXEVCFG_SHIFT) & 0x3]
 
     def has_interrupt(self) -> bool:
         """Check if pad has interrupt routing enabled"""
-        return ((self.dw0 & self.DW0_GPIROUTIOXAPIC_MASK) != 0 or
-                (self.dw0 & self.DW0_GPIROUTSCI_MASK) != 0 or
-                (self.dw0 & self.DW0_GPIROUTSMI_MASK) != 0 or
-                (self.dw0 & self.DW0_GPIROUTNMI_MASK) != 0)
+        return (self.dw0 & DW0_GPIROUT_MASK) != 0
 
     def get_interrupt_type(self) -> str:
         """Determine interrupt routing type"""
-        if self.dw0 & self.DW0_GPIROUTIOXAPIC_MASK:
-            return 'APIC'
-        elif self.dw0 & self.DW0_GPIROUTSCI_MASK:
-            return 'SCI'
-        elif self.dw0 & self.DW0_GPIROUTSMI_MASK:
-            return 'SMI'
-        elif self.dw0 & self.DW0_GPIROUTNMI_MASK:
-            return 'NMI'
-        return 'NONE'
+        return _INTERRUPT_TYPE_BY_ROUTE[(self.dw0 >> DW0_GPIROUTNMI_SHIFT) & 0xF]
 
     def get_rx_invert(self) -> bool:
         """Check if RX is inverted (DW0[23])"""
-        return (self.dw0 & self.DW0_RXINV_MASK) != 0
+        return (self.dw0 & DW0_RXINV_MASK) != 0
 
     def validate(self) -> bool:
         """
@@ -350,22 +535,17 @@ class AlderLakeGpioPadConfig:
         # Issue #1 Fix: Check raw bits directly to avoid Enum masking
         
         # Check pad mode (DW0[12:10]) is in valid range (0-7)
-        # The mask is 0x1C00 (0b1110000000000)
-        mode_raw = (self.dw0 >> 10) & 0x7  # 3 bits
-        # Bit 13 is reserved/unused for mode in this context, but let's check the full nibble if needed
         # Actually DW0_PMODE_MASK is 0xF << 10 (bits 13:10). 
         # Valid modes are 0-7, so bit 13 (value 8) must be 0.
-        mode_full_nibble = (self.dw0 >> 10) & 0xF
-        if mode_full_nibble > 7:
+        if self._pad_mode_int() > 7:
             return False
 
         # Check reset config (DW0[31:30]) is in valid range (0-3)
         # 2 bits, so it's always 0-3, but we check for consistency if needed.
         # Actually, all 2-bit values are valid Enum members (PWROK, DEEP, PLTRST, RSMRST).
         # So this check is tautological unless we forbid specific resets for specific modes?
-        # For now, just ensuring it's extracted correctly is enough, but let's keep the check structure.
-        reset_raw = (self.dw0 >> 30) & 0x3
-        
+        # For now, just ensuring it's extracted correctly is enough.
+
         # Check for reserved bits or impossible combinations
         # Example: If Pad Mode is GPIO (0), Direction cannot be both Input and Output disabled?
         # Actually, TX_DISABLE | RX_DISABLE (0b11) is valid (Hi-Z).
@@ -384,20 +564,128 @@ class AlderLakeGpioPadConfig:
 
     def to_dict(self) -> Dict:
         """Convert to dictionary representation"""
+        # Reserved/unused pads repeat the same words, decode each value once.
+        # Return a copy, callers own the dict.
+        return dict(_decode_pad_dict(self.dw0, self.dw1))
+
+    def _decode_dict(self) -> Dict:
+        dw0 = self.dw0
+        mode = _PAD_MODE_NAMES[(dw0 >> DW0_PMODE_SHIFT) & 0xF]
+        # Decode direction and interrupt route once. The output value is
+        # reported for every output-configured pad, not only in GPIO mode.
+        direction = self.get_direction()
+        interrupt = self.get_interrupt_type()
         return {
-            'dw0': f'0x{self.dw0:08x}',
+            'dw0': f'0x{dw0:08x}',
             'dw1': f'0x{self.dw1:08x}',
-            'mode': self.get_pad_mode().name,
-            'direction': self.get_direction().name if self.get_pad_mode() == PadMode.GPIO else 'N/A',
-            'output_value': self.get_output_value() if self.get_direction() == PadDirection.OUTPUT else None,
-            'reset': self.get_reset_config().name,
-            'termination': self.get_termination().name,
-            'interrupt': self.get_interrupt_type(),
-            'trigger': self.get_trigger_type().name if self.has_interrupt() else 'N/A',
+            'mode': mode,
+            'direction': direction.name if mode == 'GPIO' else 'N/A',
+            'output_value': dw0 & DW0_GPIOTXSTATE_MASK if direction == PadDirection.OUTPUT else None,
+            'reset': _PAD_RESET_NAMES[(dw0 >> DW0_PADRST_CFG_SHIFT) & 0x3],
+            'termination': _PAD_PULL_NAMES[(self.dw1 >> DW1_TERM_SHIFT) & 0xF],
+            'interrupt': interrupt,
+            'trigger': _PAD_TRIGGER_NAMES[(dw0 >> DW0_RXEVCFG_SHIFT) & 0x3] if interrupt != 'NONE' else 'N/A',
             'rx_invert': self.get_rx_invert(),
         }
 
 
+@lru_cache(maxsize=4096)
+def _decode_pad_dict(dw0: int, dw1: int) -> Dict:
+    """to_dict() only depends on DW0 and DW1"""
+    return AlderLakeGpioPadConfig.from_words(dw0, dw1)._decode_dict()
+
+
+def decode_modes(dw0: np.ndarray) -> np.ndarray:
+    """Raw PMODE field of every DW0 (index into PadMode)"""
+    return ((dw0 >> DW0_PMODE_SHIFT) & 0xF).astype(np.uint8)
+
+
+def decode_resets(dw0: np.ndarray) -> np.ndarray:
+    """Raw PADRSTCFG field of every DW0 (PadReset value)"""
+    return ((dw0 >> DW0_PADRST_CFG_SHIFT) & 0x3).astype(np.uint8)
+
+
+def decode_rxtx(dw0: np.ndarray) -> np.ndarray:
+    """Raw RX/TX disable field of every DW0 (RxTxConfig value)"""
+    return ((dw0 >> DW0_GPIORXTXDIS_SHIFT) & 0x3).astype(np.uint8)
+
+
+def decode_triggers(dw0: np.ndarray) -> np.ndarray:
+    """Raw RXEVCFG field of every DW0 (PadTrigger value)"""
+    return ((dw0 >> DW0_RXEVCFG_SHIFT) & 0x3).astype(np.uint8)
+
+
+def decode_terms(dw1: np.ndarray) -> np.ndarray:
+    """Raw TERM field of every DW1 (index into PadPull)"""
+    return ((dw1 >> DW1_TERM_SHIFT) & 0xF).astype(np.uint8)
+
+
+def decode_table(dw0: np.ndarray, dw1: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Decode the bitfields of many pads at once from their DW0/DW1 columns.
+
+    The vectorized counterpart of the get_*() methods: every field is one
+    mask-and-shift over the whole column. Enum names are left to the caller.
+
+    Returns:
+        Dict of per-pad column arrays: dw0, dw1, mode, reset, rxtx,
+        direction, tx_state, has_interrupt, trigger, term and intsel
+    """
+    rxtx = decode_rxtx(dw0)
+
+    return {
+        'dw0': dw0,
+        'dw1': dw1,
+        'mode': decode_modes(dw0),
+        'reset': decode_resets(dw0),
+        'rxtx': rxtx,
+        'direction': _DIRECTION_BY_RXTX_ARRAY[rxtx],
+        'tx_state': (dw0 & DW0_GPIOTXSTATE_MASK).astype(np.uint8),
+        'has_interrupt': (dw0 & DW0_GPIROUT_MASK) != 0,
+        'trigger': decode_triggers(dw0),
+        'term': decode_terms(dw1),
+        'intsel': (dw1 & DW1_INTSEL_MASK).astype(np.uint8),
+    }
+
+
+def validate_table(dw0: np.ndarray, dw1: np.ndarray) -> np.ndarray:
+    """
+    Vectorized AlderLakeGpioPadConfig.validate() over DW0/DW1 columns.
+
+    Returns:
+        Bool array, True where the pad configuration appears valid
+    """
+    return (((dw0 | dw1) != 0) &
+            (dw0 != 0xFFFFFFFF) & (dw1 != 0xFFFFFFFF) &
+            (((dw0 >> DW0_PMODE_SHIFT) & 0xF) <= 7))
+
+
+def parse_pad_table(raw, n_pads: int, entry_size: int = 8,
+                    offset: int = 0) -> Dict[str, np.ndarray]:
+    """
+    Decode a whole table of pad config entries at once.
+
+    Instead of one AlderLakeGpioPadConfig per pad, the DW0/DW1 words are viewed
+    in place and handed to decode_table().
+
+    Args:
+        raw: Buffer containing the table
+        n_pads: Number of entries to decode
+        entry_size: Size of one entry in bytes (a multiple of 4, at least 8)
+        offset: Offset of the first entry in raw
+
+    Returns:
+        Column dict as returned by decode_table()
+    """
+    entries = AlderLakeGpioPadConfig.parse_table(raw, offset, entry_size, n_pads)
+    # Gather both words into contiguous columns once; the columns of the
+    # table view are strided, which every derived column would pay for
+    return decode_table(np.ascontiguousarray(entries[:, 0]),
+                        np.ascontiguousarray(entries[:, 1]))
+
+
+# Called for every parsed pad, over a few hundred distinct (group, index) pairs
+@lru_cache(maxsize=1024)
 def get_pad_name(group: str, index: int) -> str:
     if group.startswith('VGPIO'):
         if group == 'VGPIO':
@@ -414,30 +702,33 @@ def resolve_global_pad_name(global_index: int) -> Tuple[str, int]:
     Map a global linear index to a (group, local_index) tuple
     based on the physical layout of the extracted table.
     """
-    current_idx = 0
-
-    for group_name, count in ALDERLAKE_S_GROUPS_ORDER:
-        if global_index < current_idx + count:
-            local_index = global_index - current_idx
-            return (group_name, local_index)
-        current_idx += count
+    i = bisect_right(_GROUP_ORDER_STARTS, global_index) - 1
+    if 0 <= i < len(_GROUP_ORDER_NAMES):
+        return (_GROUP_ORDER_NAMES[i], global_index - _GROUP_ORDER_STARTS[i])
 
     return (None, None)
 
 
 def find_group_for_pad(pad_number: int, community: int) -> Optional[Tuple[str, int]]:
     """Legacy helper."""
-    for group_name, info in GPIO_GROUPS.items():
-        if info['community'] != community:
-            continue
-
-        if info['pad_start'] <= pad_number < info['pad_start'] + info['pad_count']:
-            local_index = pad_number - info['pad_start']
-            return (group_name, local_index)
+    starts, rows = _COMMUNITY_GROUPS.get(community, ((), ()))
+    i = bisect_right(starts, pad_number) - 1
+    if i >= 0:
+        pad_start, pad_end, group_name = rows[i]
+        if pad_number < pad_end:
+            return (group_name, pad_number - pad_start)
 
     return None
 
 
+# Derived from GPIO_GROUPS once at import: community numbers in ascending
+# order, and every pad name in GPIO_GROUPS order
+COMMUNITIES = tuple(sorted(_COMMUNITY_GROUPS))
+ALL_PAD_NAMES = tuple(get_pad_name(group, index)
+                      for group, info in GPIO_GROUPS.items()
+                      for index in range(info['pad_count']))
+
+
 # Known UEFI module names/patterns that typically contain GPIO configuration
 # Note: Only verified patterns are included. Unverified FSP GUIDs have been removed.
 #       These patterns are derived from:
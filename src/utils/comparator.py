@@ -10,12 +10,24 @@ It is used to validate the extraction accuracy.
 """
 
 import argparse
+import io
 import json
+import mmap
 import re
 import sys
 import logging
+import os
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
+
+# Optional: stream pads out of large JSON dumps instead of loading them whole.
+# Numbers are decoded with use_float=True (plain floats like json, not
+# Decimal), which needs ijson >= 3.1; older versions fall back to json.
+try:
+    import ijson
+    list(ijson.items(io.BytesIO(b'[]'), 'item', use_float=True))
+except (ImportError, TypeError):
+    ijson = None
 
 # Configure logging
 logging.basicConfig(
@@ -26,7 +38,38 @@ logger = logging.getLogger(__name__)
 
 # Regex for parsing coreboot GPIO macros
 # Matches: PAD_CFG_MACRO(PAD_NAME, ARG1, ARG2, ...) and _PAD_CFG_STRUCT
-MACRO_REGEX = re.compile(r'^\s*(_?PAD_CFG_[A-Z0-9_]+|_PAD_CFG_STRUCT)\s*\((.+)\)\s*,?\s*(?:/\*.*?\*/)?\s*$')
+# Applied to the whole (memory-mapped) file, one match per line ([^\S\n] is
+# whitespace that doesn't cross into the next line, it also absorbs the \r of
+# CRLF line ends)
+MACRO_REGEX = re.compile(rb'^[^\S\n]*(_?PAD_CFG_[A-Z0-9_]+|_PAD_CFG_STRUCT)[^\S\n]*\((.+)\)'
+                         rb'[^\S\n]*,?[^\S\n]*(?:/\*.*?\*/)?[^\S\n]*$', re.MULTILINE)
+
+# Characters that delimit or nest macro arguments (see split_macro_args())
+ARG_DELIM_REGEX = re.compile(r'[(),]')
+NF_FUNC_REGEX = re.compile(r'PAD_FUNC\((NF\d+)\)')
+
+def split_macro_args(args_str: str) -> List[str]:
+    """
+    Split macro arguments on top-level commas.
+
+    Commas inside parentheses like PAD_IRQ_CFG(IOAPIC, LEVEL, NONE) stay in
+    their argument, and an empty argument stays in place as '', so later
+    arguments keep their positions.
+    """
+    args = []
+    depth = 0
+    start = 0
+    for m in ARG_DELIM_REGEX.finditer(args_str):
+        delim = m.group()
+        if delim == '(':
+            depth += 1
+        elif delim == ')':
+            depth = max(depth - 1, 0)
+        elif depth == 0:
+            args.append(args_str[start:m.start()].strip())
+            start = m.end()
+    args.append(args_str[start:].strip())
+    return args
 
 def parse_gpio_h(file_path: Path) -> Dict[str, Dict]:
     """
@@ -40,71 +83,70 @@ def parse_gpio_h(file_path: Path) -> Dict[str, Dict]:
     """
     pads = {}
 
-    with open(file_path, 'r') as f:
-        lines = f.readlines()
-
-    for line in lines:
-        line = line.strip()
-        match = MACRO_REGEX.match(line)
-        if match:
-            macro_name = match.group(1)
-            args_str = match.group(2)
-
-            # Split args by comma, respecting parentheses (simple version)
-            # This handles simple macros. Complex logic like (A | B) might need more robust parsing
-            args = [a.strip() for a in args_str.split(',')]
-
-            if not args:
-                continue
-
-            pad_name = args[0]
-
-            # Basic interpretation based on macro type
-            config = {
-                'macro': macro_name,
-                'args': args,
-                'name': pad_name
-            }
-
-            # Handle _PAD_CFG_STRUCT (VGPIOs)
-            if macro_name == '_PAD_CFG_STRUCT':
-                # _PAD_CFG_STRUCT(pad_name, flags, dw1)
-                # Parse flags to extract mode
-                if len(args) > 1:
-                    flags = args[1]
-                    if 'PAD_FUNC(GPIO)' in flags:
-                        config['mode'] = 'GPIO'
-                        # Determine direction from buffer config
-                        if 'PAD_BUF(RX_DISABLE)' in flags or 'RX_DISABLE' in flags:
-                            config['direction'] = 'OUTPUT'
-                        elif 'PAD_BUF(TX_DISABLE)' in flags or 'TX_DISABLE' in flags:
-                            config['direction'] = 'INPUT'
-                        else:
-                            config['direction'] = 'INPUT'  # Default
-                    elif 'PAD_FUNC(NF' in flags:
-                        # Extract NF number
-                        nf_match = re.search(r'PAD_FUNC\((NF\d+)\)', flags)
-                        if nf_match:
-                            config['mode'] = nf_match.group(1)
-                        else:
-                            config['mode'] = 'NF'
-            # Handle standard macros
-            elif 'GPO' in macro_name:
-                config['mode'] = 'GPIO'
-                config['direction'] = 'OUTPUT'
-                if len(args) > 1:
-                    config['output_value'] = 1 if args[1] == '1' else 0
-            elif 'GPI' in macro_name:
-                config['mode'] = 'GPIO'
-                config['direction'] = 'INPUT'
-            elif 'NF' in macro_name:
-                # PAD_CFG_NF(pad, term, rst, func)
-                if len(args) >= 4:
-                    config['mode'] = args[3] # NF1, NF2, etc.
-                else:
-                    config['mode'] = 'NF'
-
-            pads[pad_name] = config
+    with open(file_path, 'rb') as f:
+        # mmap can't map an empty file, which has no pads anyway
+        if os.fstat(f.fileno()).st_size == 0:
+            return pads
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as text:
+            matches = [(m.group(1).decode(), m.group(2).decode())
+                       for m in MACRO_REGEX.finditer(text)]
+
+    for macro_name, args_str in matches:
+
+        # Split args by top-level comma, respecting parentheses
+        args = split_macro_args(args_str)
+
+        if not args:
+            continue
+
+        pad_name = args[0]
+
+        # Basic interpretation based on macro type
+        config = {
+            'macro': macro_name,
+            'args': args,
+            'name': pad_name
+        }
+
+        # Handle _PAD_CFG_STRUCT (VGPIOs)
+        if macro_name == '_PAD_CFG_STRUCT':
+            # _PAD_CFG_STRUCT(pad_name, flags, dw1)
+            # Parse flags to extract mode
+            if len(args) > 1:
+                flags = args[1]
+                if 'PAD_FUNC(GPIO)' in flags:
+                    config['mode'] = 'GPIO'
+                    # Determine direction from buffer config
+                    if 'PAD_BUF(RX_DISABLE)' in flags or 'RX_DISABLE' in flags:
+                        config['direction'] = 'OUTPUT'
+                    elif 'PAD_BUF(TX_DISABLE)' in flags or 'TX_DISABLE' in flags:
+                        config['direction'] = 'INPUT'
+                    else:
+                        config['direction'] = 'INPUT'  # Default
+                elif 'PAD_FUNC(NF' in flags:
+                    # Extract NF number
+                    nf_match = NF_FUNC_REGEX.search(flags)
+                    if nf_match:
+                        config['mode'] = nf_match.group(1)
+                    else:
+                        config['mode'] = 'NF'
+        # Handle standard macros
+        elif 'GPO' in macro_name:
+            config['mode'] = 'GPIO'
+            config['direction'] = 'OUTPUT'
+            if len(args) > 1:
+                config['output_value'] = 1 if args[1] == '1' else 0
+        elif 'GPI' in macro_name:
+            config['mode'] = 'GPIO'
+            config['direction'] = 'INPUT'
+        elif 'NF' in macro_name:
+            # PAD_CFG_NF(pad, term, rst, func)
+            if len(args) >= 4:
+                config['mode'] = args[3] # NF1, NF2, etc.
+            else:
+                config['mode'] = 'NF'
+
+        pads[pad_name] = config
 
     return pads
 
@@ -118,24 +160,50 @@ def load_json(file_path: Path) -> Dict[str, Dict]:
     Returns:
         Dict mapping pad name to configuration dict
     """
-    with open(file_path, 'r') as f:
-        data = json.load(f)
-
     pads = {}
 
-    # Handle both raw output and normalized output
-    pad_list = data.get('pads', [])
-    if not pad_list and 'tables' in data:
-        # Fallback: use first table if 'pads' not present
-        pad_list = data['tables'][0].get('pads', [])
-
-    for pad in pad_list:
+    for pad in _iter_json_pads(file_path):
         name = pad.get('name')
         if name:
             pads[name] = pad
 
     return pads
 
+def _iter_json_pads(file_path: Path) -> Iterator[Dict]:
+    """
+    Yield the pad dicts of a JSON dump.
+
+    With ijson available the pads are decoded one at a time, without
+    building the rest of the document.
+    """
+    if ijson is None:
+        with open(file_path, 'r') as f:
+            data = json.load(f)
+
+        # Handle both raw output and normalized output
+        pad_list = data.get('pads', [])
+        tables = data.get('tables')
+        if not pad_list and tables:
+            # Fallback: use first table if 'pads' not present (no pads
+            # at all for an empty table list, as in the ijson path)
+            pad_list = tables[0].get('pads', [])
+        yield from pad_list
+        return
+
+    with open(file_path, 'rb') as f:
+        found = False
+        for pad in ijson.items(f, 'pads.item', use_float=True):
+            found = True
+            yield pad
+        if found:
+            return
+
+        # Fallback: use first table if 'pads' not present
+        f.seek(0)
+        table = next(ijson.items(f, 'tables.item', use_float=True), None)
+    if table:
+        yield from table.get('pads', [])
+
 def compare_pads(extracted: Dict[str, Dict], reference: Dict[str, Dict]) -> Dict:
     """
     Compare extracted pads against reference.
@@ -157,14 +225,19 @@ def compare_pads(extracted: Dict[str, Dict], reference: Dict[str, Dict]) -> Dict
         'extra_in_extracted': []
     }
 
-    # Check reference pads
+    exact_matches = results['exact_matches']
+    partial_matches = results['partial_matches']
+    mismatches = results['mismatches']
+    missing = results['missing_in_extracted']
+
+    # Check reference pads (one lookup per pad, pad dicts are never None)
+    get_extracted = extracted.get
     for name, ref_pad in reference.items():
-        if name not in extracted:
-            results['missing_in_extracted'].append(name)
+        ext_pad = get_extracted(name)
+        if ext_pad is None:
+            missing.append(name)
             continue
 
-        ext_pad = extracted[name]
-
         # Comparison logic
         # 1. Compare Mode
         ref_mode = ref_pad.get('mode')
@@ -183,26 +256,26 @@ def compare_pads(extracted: Dict[str, Dict], reference: Dict[str, Dict]) -> Dict
                     ref_dir = ref_pad.get('direction')
                     ext_dir = ext_pad.get('direction')
                     if ref_dir and ext_dir and ref_dir != ext_dir:
-                        results['partial_matches'].append({
+                        partial_matches.append({
                             'pad': name,
                             'issue': f"Direction mismatch: Ref={ref_dir}, Ext={ext_dir}"
                         })
                         continue
 
-                results['exact_matches'].append(name)
+                exact_matches.append(name)
             else:
-                results['mismatches'].append({
+                mismatches.append({
                     'pad': name,
                     'issue': f"Mode mismatch: Ref={ref_mode}, Ext={ext_mode}"
                 })
         else:
              # Loose comparison if mode missing
-             results['exact_matches'].append(name)
+             exact_matches.append(name)
 
-    # Check for extra pads
-    for name in extracted:
-        if name not in reference:
-            results['extra_in_extracted'].append(name)
+    # Check for extra pads (set difference, reported in extraction order)
+    extra = extracted.keys() - reference.keys()
+    if extra:
+        results['extra_in_extracted'] = [name for name in extracted if name in extra]
 
     return results
 
@@ -1,11 +1,35 @@
 #!/usr/bin/env python3
 import logging
+import mmap
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 logger = logging.getLogger(__name__)
 
+# One pass over the whole header for both macro forms, one match per line
+# ([^\S\n] is whitespace that doesn't cross into the next line):
+# - standard macros: PAD_CFG_NF(GPP_A0, ..., NF1) -> groups 1, 2 and the
+#   fourth comma-separated field of the line (the NF function), if any, -> 3
+# - VGPIO macros: _PAD_CFG_STRUCT(VGPIO_0, PAD_FUNC(NF1)...) -> groups 4, 5
+_REFERENCE_MACRO_RE = re.compile(
+    rb'^[^\S\n]*(?:PAD_CFG_([A-Z0-9_]+)[^\S\n]*\(([^,\n]+),(?:[^,\n]*,[^,\n]*,([^,\n]*))?'
+    rb'|_PAD_CFG_STRUCT[^\S\n]*\(([^,\n]+),[^\S\n]*(.+?),)',
+    re.MULTILINE)
+_PAD_FUNC_NF_RE = re.compile(r'PAD_FUNC\(NF(\d+)\)')
+
+@lru_cache(maxsize=None)
+def _mode_str_to_int(mode: str) -> int:
+    """Integer mode of a mode name ('NF3' -> 3); only a handful of names occur"""
+    if mode.startswith('NF'):
+        try:
+            return int(mode[2:])
+        except ValueError:
+            return 1
+    return 0
+
 class GPIOComposer:
     def __init__(self, platform: str = 'alderlake'):
         self.platform = platform
@@ -13,44 +37,40 @@ class GPIOComposer:
     def parse_reference_header(self, filepath: Path) -> Optional[Dict[str, int]]:
         """Parses the reference gpio.h file."""
         modes = {}
-        # Regex for standard macros: PAD_CFG_NF(GPP_A0, ..., NF1)
-        regex = re.compile(r'^\s*PAD_CFG_([A-Z0-9_]+)\s*\(([^,]+),')
-        # Regex for VGPIO macros: _PAD_CFG_STRUCT(VGPIO_0, PAD_FUNC(NF1)...)
-        vgpio_regex = re.compile(r'^\s*_PAD_CFG_STRUCT\s*\(([^,]+),\s*(.+?),')
 
         try:
-            with open(filepath, 'r') as f:
-                for line in f:
-                    match = regex.match(line)
-                    if match:
-                        pad = match.group(2).strip()
-                        # Simple mode extraction
-                        mode = 0
-                        if 'NF' in match.group(1):
-                            parts = line.split(',')
-                            if len(parts) >= 4 and 'NF' in parts[3]:
-                                try: 
-                                    mode_str = parts[3].strip().replace('NF', '').replace(')', '')
-                                    mode = int(mode_str)
-                                except: 
-                                    mode = 1
-                            else: 
-                                mode = 1
-                        modes[pad] = mode
-                        continue
-
-                    vgpio_match = vgpio_regex.match(line)
-                    if vgpio_match:
-                        pad = vgpio_match.group(1).strip()
-                        config_str = vgpio_match.group(2)
-                        mode = 0
-                        if 'PAD_FUNC(NF' in config_str:
-                            nf_match = re.search(r'PAD_FUNC\(NF(\d+)\)', config_str)
-                            if nf_match: 
-                                mode = int(nf_match.group(1))
-                            else: 
-                                mode = 1
-                        modes[pad] = mode
+            with open(filepath, 'rb') as f:
+                # mmap can't map an empty file, which has no pads anyway
+                if os.fstat(f.fileno()).st_size == 0:
+                    return modes
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    matches = [m.groups() for m in _REFERENCE_MACRO_RE.finditer(mm)]
+
+            for macro, pad, nf_field, vgpio_pad, config_str in matches:
+                if macro is not None:
+                    pad = pad.decode().strip()
+                    # Simple mode extraction
+                    mode = 0
+                    if b'NF' in macro:
+                        if nf_field is not None and b'NF' in nf_field:
+                            # 'NF3)' -> 'NF3' -> 3, a malformed number -> 1
+                            mode_str = nf_field.decode().strip().replace('NF', '').replace(')', '')
+                            mode = _mode_str_to_int('NF' + mode_str)
+                        else:
+                            mode = 1
+                    modes[pad] = mode
+                    continue
+
+                pad = vgpio_pad.decode().strip()
+                config_str = config_str.decode()
+                mode = 0
+                if 'PAD_FUNC(NF' in config_str:
+                    nf_match = _PAD_FUNC_NF_RE.search(config_str)
+                    if nf_match:
+                        mode = int(nf_match.group(1))
+                    else:
+                        mode = 1
+                modes[pad] = mode
         except Exception as e:
             logger.error(f"Failed to parse reference: {e}")
             return None
@@ -58,11 +78,9 @@ class GPIOComposer:
 
     def _get_mode(self, pad: Dict[str, Any]) -> int:
         """Extract integer mode from pad configuration."""
-        if isinstance(pad.get('mode'), str) and pad['mode'].startswith('NF'):
-            try: 
-                return int(pad['mode'][2:])
-            except: 
-                return 1
+        mode = pad.get('mode')
+        if isinstance(mode, str):
+            return _mode_str_to_int(mode)
         return 0
 
     def _calculate_score(self, state: Dict[str, Any], reference: Dict[str, int]) -> int:
@@ -90,12 +108,13 @@ class GPIOComposer:
         # Pick the table that matches the reference best
         base_table = None
         best_score = -1
+        # A pad matches when its (name, mode) pair is one of the reference's;
+        # membership is counted per pad so duplicate names score as before
+        ref_pairs = frozenset(reference.items())
         
         for t in parsed_tables:
-            score = 0
-            for p in t['pads']:
-                if p['name'] in reference and self._get_mode(p) == reference[p['name']]:
-                    score += 1
+            pairs = zip([p['name'] for p in t['pads']], map(self._get_mode, t['pads']))
+            score = sum(map(ref_pairs.__contains__, pairs))
             if score > best_score:
                 best_score = score
                 base_table = t
@@ -110,6 +129,10 @@ class GPIOComposer:
         # Start with Base State
         current_state = {p['name']: p for p in base_table['pads']}
         applied_tables = [base_table['id']]
+        # Reference pads the current state already gets right; only pads
+        # matching the reference are ever applied, so this only grows
+        satisfied = {name for name, p in current_state.items()
+                     if name in reference and self._get_mode(p) == reference[name]}
 
         logger.info("Starting Oracle Composition...")
 
@@ -120,23 +143,30 @@ class GPIOComposer:
 
             useful = False
             for p in t['pads']:
+                name = p['name']
+                # Check if it improves the current state (two set/dict lookups
+                # reject most pads before anything else is looked at)
+                if name not in reference or name in satisfied:
+                    continue
+
                 # Skip empty entries
                 if p.get('dw0') == '0x00000000' and p.get('dw1') == '0x00000000': continue
 
-                name = p['name']
-                if name in reference:
-                    # Check if this pad matches the reference
-                    if self._get_mode(p) == reference[name]:
-                        # Check if it improves the current state
-                        current_match = (name in current_state and self._get_mode(current_state[name]) == reference[name])
-                        if not current_match:
-                            current_state[name] = p
-                            useful = True
+                # Check if this pad matches the reference
+                if self._get_mode(p) == reference[name]:
+                    current_state[name] = p
+                    satisfied.add(name)
+                    useful = True
 
             if useful:
                 applied_tables.append(t['id'])
 
-        final_score = self._calculate_score(current_state, reference)
+            # Nothing left for the remaining tables to improve
+            if len(satisfied) == len(reference):
+                break
+
+        # The satisfied set is exactly what _calculate_score() would count
+        final_score = len(satisfied)
         logger.info(f"Final Composite Score: {final_score}/{len(reference)}")
         
         return current_state
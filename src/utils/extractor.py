@@ -14,11 +14,40 @@ import subprocess
 import tempfile
 import shutil
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Non-BIOS regions in the extraction output, never descended into
+IGNORED_REGION_DIRS = ['me region', 'descriptor region', 'gbe region']
+
+# Lowercase suffixes of module files worth scanning ('' covers UEFIExtract's
+# extensionless section files)
+_BINARY_SUFFIXES = frozenset({'.bin', '.efi', '.pe32', '.raw', '.ui', ''})
+
+
+def _link_or_copy(src: Path, dst: Path):
+    """
+    Make src available at dst without copying the data when possible.
+
+    The BIOS images are only read from their work dir copies, so a hard link
+    (same filesystem) or a symlink is as good as a copy.
+    """
+    if dst.exists() or dst.is_symlink():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    try:
+        os.symlink(Path(src).resolve(), dst)
+        return
+    except OSError:
+        pass
+    shutil.copy(src, dst)
+
 
 class UEFIExtractor:
     """Extracts and organizes UEFI modules from vendor BIOS images"""
@@ -47,6 +76,10 @@ class UEFIExtractor:
         self.bios_region_path: Optional[Path] = None
         self.extracted_modules_dir: Optional[Path] = None
         self.modules: List[Dict] = []
+        # Resolved external tool paths (or None), looked up once per tool
+        self._tool_cache: Dict[str, Optional[str]] = {}
+        # (extraction dir, [(directory, file names)]) of the last walk
+        self._walk_cache: Optional[Tuple[Path, List[Tuple[str, List[str]]]]] = None
 
     def __del__(self):
         """Cleanup temporary directory if created"""
@@ -57,7 +90,12 @@ class UEFIExtractor:
                 pass
 
     def _find_tool(self, tool_name: str) -> Optional[str]:
-        """Helper to find binary in PATH or adjacent dirs"""
+        """Helper to find binary in PATH or adjacent dirs (cached per tool)"""
+        if tool_name not in self._tool_cache:
+            self._tool_cache[tool_name] = self._lookup_tool(tool_name)
+        return self._tool_cache[tool_name]
+
+    def _lookup_tool(self, tool_name: str) -> Optional[str]:
         # 1. Check system PATH
         path = shutil.which(tool_name)
         if path:
@@ -130,11 +168,12 @@ class UEFIExtractor:
         cmd = [ifdtool_path, '-x', '-p', platform, str(self.bios_image)]
 
         try:
-            result = subprocess.run(
+            # Only stderr is ever looked at (on failure), keep it as bytes
+            subprocess.run(
                 cmd,
                 cwd=str(self.work_dir),
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 check=True
             )
 
@@ -153,7 +192,7 @@ class UEFIExtractor:
             return self.bios_region_path
 
         except subprocess.CalledProcessError as e:
-            logger.warning(f"ifdtool failed: {e.stderr}")
+            logger.warning(f"ifdtool failed: {e.stderr.decode(errors='replace')}")
             logger.info("Assuming input is raw BIOS region without IFD")
             self.bios_region_path = self.bios_image
             return self.bios_region_path
@@ -165,6 +204,9 @@ class UEFIExtractor:
         Returns:
             Path to directory containing extracted modules
         """
+        # New extraction output, walk it again
+        self._walk_cache = None
+
         uefi_extract = self._find_tool('UEFIExtract')
         if not uefi_extract:
             logger.warning("UEFIExtract not available, will work with raw BIOS region")
@@ -176,7 +218,7 @@ class UEFIExtractor:
             # Copy BIOS region to work dir for analysis
             target_file = self.extracted_modules_dir / 'bios_region.bin'
             if self.bios_region_path.resolve() != target_file.resolve():
-                shutil.copy(self.bios_region_path, target_file)
+                _link_or_copy(self.bios_region_path, target_file)
             return self.extracted_modules_dir
 
         self.extracted_modules_dir = self.work_dir / 'uefi_extracted'
@@ -185,18 +227,19 @@ class UEFIExtractor:
         # Try extracting from the full BIOS image first (more reliable for UEFIExtract)
         # Copy to work dir to keep things clean
         local_image = self.extracted_modules_dir / self.bios_image.name
-        shutil.copy(self.bios_image, local_image)
+        _link_or_copy(self.bios_image, local_image)
         
         cmd = [uefi_extract, str(local_image), 'all']
         
         try:
             # UEFIExtract might return non-zero on partial errors (e.g. code 8)
             # We allow this if it produces output
+            # Its (verbose) output is never used, don't collect it
             subprocess.run(
                 cmd,
                 cwd=str(self.extracted_modules_dir),
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False 
             )
             
@@ -216,7 +259,7 @@ class UEFIExtractor:
             self.extract_bios_region()
             
         local_bios_copy = self.extracted_modules_dir / 'bios_for_extraction.bin'
-        shutil.copy(self.bios_region_path, local_bios_copy)
+        _link_or_copy(self.bios_region_path, local_bios_copy)
 
         cmd = [uefi_extract, str(local_bios_copy), 'all']
 
@@ -224,8 +267,8 @@ class UEFIExtractor:
             subprocess.run(
                 cmd,
                 cwd=str(self.extracted_modules_dir),
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 check=False
             )
 
@@ -259,46 +302,64 @@ class UEFIExtractor:
         seen_paths = set()
 
         # Ignore these non-BIOS regions to avoid false positives (e.g. ME GPIO tables)
-        IGNORE_DIRS = ['me region', 'descriptor region', 'gbe region', 'padding']
+        IGNORE_DIRS = IGNORED_REGION_DIRS + ['padding']
+
+        # Keep each extracted file with its relative path (includes parent
+        # dir names) for the pattern checks
+        # Every walked path starts with the extraction root and a separator,
+        # the relative path is the rest of the string
+        rel_start = len(os.path.join(self.extracted_modules_dir, ''))
+        candidates = []
+        for root, files in self._walk_extracted():
+            for file in files:
+                full_path = os.path.join(root, file)
+                path_str = full_path[rel_start:].lower()
+
+                # SKIP if in ignored region
+                if any(ignore in path_str for ignore in IGNORE_DIRS):
+                    continue
+
+                candidates.append((full_path, file, path_str))
 
         # Search for files matching patterns
         for pattern in patterns:
             pattern_lower = pattern.lower()
 
-            # Walk through extracted directory
-            for root, dirs, files in os.walk(self.extracted_modules_dir):
-                for file in files:
-                    file_path = Path(root) / file
-
-                    # Get path relative to extraction root to check directory names
-                    try:
-                        rel_path = file_path.relative_to(self.extracted_modules_dir)
-                    except ValueError:
-                        continue
-
-                    path_str = str(rel_path).lower()
-
-                    # SKIP if in ignored region
-                    if any(ignore in path_str for ignore in IGNORE_DIRS):
-                        continue
-
-                    # Check pattern against the relative path (includes parent dir names)
-                    if pattern_lower in path_str:
-                        if str(file_path) not in seen_paths:
-                            module_info = {
-                                'path': file_path,
-                                'name': file,
-                                'size': file_path.stat().st_size,
-                                'pattern': pattern,
-                            }
-                            matching_modules.append(module_info)
-                            seen_paths.add(str(file_path))
+            for full_path, file, path_str in candidates:
+                # Check pattern against the relative path (includes parent dir names)
+                if pattern_lower in path_str:
+                    if full_path not in seen_paths:
+                        module_info = {
+                            'path': Path(full_path),
+                            'name': file,
+                            'size': os.stat(full_path).st_size,
+                            'pattern': pattern,
+                        }
+                        matching_modules.append(module_info)
+                        seen_paths.add(full_path)
 
         self.modules = matching_modules
         logger.info(f"Found {len(matching_modules)} modules matching patterns (excluding ME/Descriptor)")
 
         return matching_modules
 
+    def _walk_extracted(self) -> List[Tuple[str, List[str]]]:
+        """
+        Directories and file names below the extraction dir.
+
+        The tree is walked once per extraction dir and shared by find_modules()
+        and get_all_binary_files(). Ignored regions are pruned from the walk,
+        so their subtrees are never listed.
+        """
+        if self._walk_cache is None or self._walk_cache[0] != self.extracted_modules_dir:
+            entries = []
+            for root, dirs, files in os.walk(self.extracted_modules_dir):
+                dirs[:] = [d for d in dirs
+                           if not any(ignore in d.lower() for ignore in IGNORED_REGION_DIRS)]
+                entries.append((root, files))
+            self._walk_cache = (self.extracted_modules_dir, entries)
+        return self._walk_cache[1]
+
     def get_bios_region(self) -> Path:
         """
         Get path to BIOS region (extracting if necessary).
@@ -321,17 +382,19 @@ class UEFIExtractor:
             self.extract_uefi_modules()
 
         binary_files = []
-        IGNORE_DIRS = ['me region', 'descriptor region', 'gbe region']
 
-        for root, dirs, files in os.walk(self.extracted_modules_dir):
+        for root, files in self._walk_extracted():
             # Skip ignored directories early
-            if any(ignore in str(Path(root)).lower() for ignore in IGNORE_DIRS):
+            if any(ignore in root.lower() for ignore in IGNORED_REGION_DIRS):
                 continue
 
             for file in files:
-                file_path = Path(root) / file
+                name = file.lower()
+                # Same rule as Path.suffix, without building a Path per file
+                dot = name.rfind('.')
+                suffix = name[dot:] if 0 < dot < len(name) - 1 else ''
                 # Look for .bin, .efi, .pe32, .raw files and 'body' files from UEFIExtract
-                if file_path.suffix.lower() in ['.bin', '.efi', '.pe32', '.raw', '.ui', ''] or 'body' in file_path.name.lower():
-                    binary_files.append(file_path)
+                if suffix in _BINARY_SUFFIXES or 'body' in name:
+                    binary_files.append(Path(root, file))
 
         return binary_files
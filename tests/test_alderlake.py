@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: GPL-2.0-only
+
+"""
+Tests for the Alder Lake pad config decoding helpers.
+"""
+
+import struct
+
+import numpy as np
+
+from src.platforms.alderlake import (
+    AlderLakeGpioPadConfig, PadMode, PadPull, PadReset,
+    decode_modes, decode_resets, decode_table, decode_terms, parse_pad_table,
+    validate_table,
+)
+
+# GPO high/PLTRST, NF1/DEEP with NAFVWE, GPIO input with 20K pull-up and APIC route
+PAD_WORDS = [
+    (0x80000201, 0x00000000),
+    (0x48000400, 0x00000000),
+    (0x40100100, 0x00003000),
+]
+
+
+def test_parse_pad_table_matches_pad_config():
+    """Vectorized table decode must agree with the per-pad accessors"""
+    for entry_size in (8, 12, 16):
+        pad = entry_size - 8
+        raw = b'\xAA' * 4 + b''.join(struct.pack('<II', dw0, dw1) + b'\x00' * pad
+                                     for dw0, dw1 in PAD_WORDS)
+        table = parse_pad_table(raw, len(PAD_WORDS), entry_size, offset=4)
+
+        for i, (dw0, dw1) in enumerate(PAD_WORDS):
+            config = AlderLakeGpioPadConfig(struct.pack('<II', dw0, dw1))
+            assert table['dw0'][i] == dw0
+            assert table['dw1'][i] == dw1
+            assert table['mode'][i] == config.get_pad_mode()
+            assert table['reset'][i] == config.get_reset_config()
+            assert table['rxtx'][i] == config.get_rxtx_config()
+            assert table['direction'][i] == config.get_direction()
+            assert table['tx_state'][i] == config.get_output_value()
+            assert table['has_interrupt'][i] == config.has_interrupt()
+            assert table['trigger'][i] == config.get_trigger_type()
+            assert table['term'][i] == config.get_termination()
+
+
+def test_parse_table_columns():
+    """Bulk table read yields one row of DW words per entry"""
+    raw = b''.join(struct.pack('<IIII', dw0, dw1, 0x11, 0x22) for dw0, dw1 in PAD_WORDS)
+
+    table = AlderLakeGpioPadConfig.parse_table(raw, stride=16)
+    assert table.shape == (len(PAD_WORDS), 4)
+    assert [tuple(row) for row in table[:, :2].tolist()] == PAD_WORDS
+    assert (table[:, 2] == 0x11).all() and (table[:, 3] == 0x22).all()
+
+    assert AlderLakeGpioPadConfig.parse_table(raw, offset=16, stride=16, count=1)[0, 0] == PAD_WORDS[1][0]
+
+
+def test_from_table_matches_from_buffer():
+    """Batch parsing yields the same words as parsing each entry"""
+    for stride in (8, 12, 16, 20):
+        raw = b'\xAA' * 4 + b''.join(struct.pack('<IIII', dw0, dw1, 0x11, 0x22) + b'\x33' * (stride - 16)
+                                     if stride >= 16 else
+                                     struct.pack('<II', dw0, dw1) + b'\x44' * (stride - 8)
+                                     for dw0, dw1 in PAD_WORDS)
+        configs = AlderLakeGpioPadConfig.from_table(raw, offset=4, stride=stride, count=len(PAD_WORDS))
+
+        assert len(configs) == len(PAD_WORDS)
+        for i, config in enumerate(configs):
+            expected = AlderLakeGpioPadConfig.from_buffer(raw, 4 + i * stride, stride)
+            assert (config.dw0, config.dw1, config.dw2, config.dw3) == \
+                (expected.dw0, expected.dw1, expected.dw2, expected.dw3)
+            assert type(config.dw0) is int
+
+
+def test_decode_helpers_return_uint8_fields():
+    """Column decoders yield the raw enum values as uint8"""
+    dw0 = np.array([dw0 for dw0, _ in PAD_WORDS], dtype=np.uint32)
+    dw1 = np.array([dw1 for _, dw1 in PAD_WORDS], dtype=np.uint32)
+
+    for decoded in (decode_modes(dw0), decode_resets(dw0), decode_terms(dw1)):
+        assert decoded.dtype == np.uint8
+
+    assert decode_modes(dw0).tolist() == [PadMode.GPIO, PadMode.NF1, PadMode.GPIO]
+    assert decode_resets(dw0).tolist() == [PadReset.PLTRST, PadReset.DEEP, PadReset.DEEP]
+    assert decode_terms(dw1).tolist() == [PadPull.NONE, PadPull.NONE, PadPull.UP_20K]
+    assert decode_table(dw0, dw1)['mode'].tolist() == decode_modes(dw0).tolist()
+
+
+def test_validate_table_matches_validate():
+    """Vectorized validity mask must agree with validate()"""
+    words = PAD_WORDS + [(0, 0), (0xFFFFFFFF, 0), (0x1, 0xFFFFFFFF), (0x2000, 0x1), (0x1C00, 0x1)]
+    dw0 = np.array([dw0 for dw0, _ in words], dtype=np.uint32)
+    dw1 = np.array([dw1 for _, dw1 in words], dtype=np.uint32)
+
+    expected = [AlderLakeGpioPadConfig.from_words(*pair).validate() for pair in words]
+    assert validate_table(dw0, dw1).tolist() == expected
+
+
+def test_pad_config_from_buffer_short_data():
+    """from_buffer returns None instead of raising on truncated entries"""
+    data = bytes(range(16))
+    assert AlderLakeGpioPadConfig.from_buffer(data, 12) is None
+
+    config = AlderLakeGpioPadConfig.from_buffer(data, 0, 8)
+    reference = AlderLakeGpioPadConfig(data[:8])
+    assert (config.dw0, config.dw1, config.dw2, config.dw3) == \
+        (reference.dw0, reference.dw1, reference.dw2, reference.dw3)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: GPL-2.0-only
+
+"""
+Tests for parsing reference gpio.h files in the comparator.
+"""
+
+from src.utils.comparator import load_json, parse_gpio_h, split_macro_args
+
+
+def test_split_macro_args_keeps_empty_and_nested_arguments():
+    """Empty arguments stay in place, parenthesised commas stay in their argument"""
+    assert split_macro_args('GPP_B0, , PLTRST') == ['GPP_B0', '', 'PLTRST']
+    assert split_macro_args('GPP_A0,,') == ['GPP_A0', '', '']
+    assert split_macro_args('VGPIO_0, PAD_FUNC(NF1) | PAD_IRQ_CFG(IOAPIC, LEVEL, NONE), PAD_PULL(NONE)') == \
+        ['VGPIO_0', 'PAD_FUNC(NF1) | PAD_IRQ_CFG(IOAPIC, LEVEL, NONE)', 'PAD_PULL(NONE)']
+
+
+def test_parse_gpio_h_empty_argument(tmp_path):
+    """An empty argument must not shift the position of the ones after it"""
+    gpio_h = tmp_path / 'gpio.h'
+    gpio_h.write_text(
+        'static const struct pad_config gpio_table[] = {\n'
+        '\tPAD_CFG_NF(GPP_A0, , DEEP, NF1),\n'
+        '\tPAD_CFG_GPO(GPP_B0, , PLTRST),\n'
+        '\tPAD_CFG_NF(GPP_C0, NONE, DEEP, NF2),\n'
+        '};\n')
+
+    pads = parse_gpio_h(gpio_h)
+
+    assert pads['GPP_A0']['args'] == ['GPP_A0', '', 'DEEP', 'NF1']
+    assert pads['GPP_A0']['mode'] == 'NF1'
+    assert pads['GPP_B0']['args'] == ['GPP_B0', '', 'PLTRST']
+    assert pads['GPP_B0']['output_value'] == 0
+    assert pads['GPP_C0']['mode'] == 'NF2'
+
+
+def test_load_json_pads_and_tables(tmp_path):
+    """Top-level pads win, else the first table's pads, an empty table list gives none"""
+    dump = tmp_path / 'dump.json'
+
+    dump.write_text('{"pads": [{"name": "GPP_A0", "mode": "NF1"}], "tables": [{"pads": [{"name": "GPP_B0"}]}]}')
+    assert list(load_json(dump)) == ['GPP_A0']
+
+    dump.write_text('{"pads": [], "tables": [{"pads": [{"name": "GPP_B0", "dw0": 1.5}]}, {"pads": [{"name": "GPP_C0"}]}]}')
+    pads = load_json(dump)
+    assert list(pads) == ['GPP_B0']
+    assert type(pads['GPP_B0']['dw0']) is float
+
+    dump.write_text('{"tables": []}')
+    assert load_json(dump) == {}
@@ -10,21 +10,24 @@ of the claim: "Two BIOS images have identical physical GPIOs."
 """
 
 import sys
-import json
-import tempfile
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from unittest.mock import Mock, MagicMock
+from types import MappingProxyType
 
 # Setup imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import pytest
 
+from tools.compare_images import compare_pads_by_type, compare_pad_set
+from tools.create_mock_bios import create_mock_bios, create_mock_vgpio_table
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def mock_physical_gpio_identical():
     """Mock pad dict: identical physical GPIOs"""
-    return {
+    return MappingProxyType({
         'GPP_B0': {
             'name': 'GPP_B0',
             'mode': 'GPIO',
@@ -58,12 +61,12 @@ def mock_physical_gpio_identical():
             'dw1': 0x80000000,
             'is_vgpio': False
         }
-    }
+    })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_physical_gpio_different():
     """Mock pad dict: different physical GPIOs"""
-    return {
+    return MappingProxyType({
         'GPP_B0': {
             'name': 'GPP_B0',
             'mode': 'GPIO',
@@ -97,12 +100,12 @@ def mock_physical_gpio_different():
             'dw1': 0x80000000,
             'is_vgpio': False
         }
-    }
+    })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_vgpio_identical():
     """Mock pad dict: identical VGPIOs"""
-    return {
+    return MappingProxyType({
         'VGPIO0': {
             'name': 'VGPIO0',
             'mode': 'GPIO',
@@ -121,12 +124,12 @@ def mock_vgpio_identical():
             'dw1': 0x00000000,
             'is_vgpio': True
         }
-    }
+    })
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_vgpio_different():
     """Mock pad dict: different VGPIOs"""
-    return {
+    return MappingProxyType({
         'VGPIO0': {
             'name': 'VGPIO0',
             'mode': 'NF1',          # DIFFERENT
@@ -145,117 +148,103 @@ def mock_vgpio_different():
             'dw1': 0x00010000,      # DIFFERENT
             'is_vgpio': True
         }
+    })
+
+# Combined images, merged once per module: (pads of image A, pads of image B)
+@pytest.fixture(scope="module")
+def pads_identical_identical(mock_physical_gpio_identical, mock_vgpio_identical):
+    """Identical physical GPIOs and identical VGPIOs"""
+    pads = MappingProxyType({**mock_physical_gpio_identical, **mock_vgpio_identical})
+    return pads, pads
+
+@pytest.fixture(scope="module")
+def pads_identical_diffvgpio(mock_physical_gpio_identical, mock_vgpio_identical,
+                             mock_vgpio_different):
+    """Identical physical GPIOs, different VGPIOs"""
+    return (MappingProxyType({**mock_physical_gpio_identical, **mock_vgpio_identical}),
+            MappingProxyType({**mock_physical_gpio_identical, **mock_vgpio_different}))
+
+@pytest.fixture(scope="module")
+def pads_diffphys_identical(mock_physical_gpio_identical, mock_physical_gpio_different,
+                            mock_vgpio_identical):
+    """Different physical GPIOs, identical VGPIOs"""
+    return (MappingProxyType({**mock_physical_gpio_identical, **mock_vgpio_identical}),
+            MappingProxyType({**mock_physical_gpio_different, **mock_vgpio_identical}))
+
+@pytest.fixture(scope="module")
+def pads_raw_register_diff():
+    """Same logical GPIO input config, different termination bits in raw DW1"""
+    # Pad A: looks like GPIO input
+    pad_a = {
+        'GPP_B0': {
+            'name': 'GPP_B0',
+            'mode': 'GPIO',
+            'direction': 'INPUT',
+            'dw0': 0x00000200,
+            'dw1': 0x80000000,
+            'is_vgpio': False
+        }
     }
 
+    # Pad B: same logical config but different termination bits in raw DW1
+    pad_b = {
+        'GPP_B0': {
+            'name': 'GPP_B0',
+            'mode': 'GPIO',
+            'direction': 'INPUT',
+            'dw0': 0x00000200,
+            'dw1': 0x80001800,  # DIFFERENT termination in raw register
+            'is_vgpio': False
+        }
+    }
+    return MappingProxyType(pad_a), MappingProxyType(pad_b)
+
+@pytest.fixture
+def image_pads(request):
+    """The (image A, image B) pads fixture named by the test parameter"""
+    return request.getfixturevalue(request.param)
+
 
 class TestCompareImagesFalsification:
     """Test suite for compare_images.py falsification framework"""
 
-    def test_physical_gpio_identical_vgpio_identical(self, 
-                                                     mock_physical_gpio_identical,
-                                                     mock_vgpio_identical):
+    @pytest.mark.parametrize("image_pads,phys_diff,vgpio_diff", [
+        # TEST CASE 1: Both physical GPIO and VGPIO are identical.
+        # This is the null case - should pass without issues.
+        ("pads_identical_identical", False, False),
+        # TEST CASE 2 (CRITICAL): Physical GPIO identical but VGPIO different.
+        # This is the KEY FALSIFICATION TEST. If compare_images.py reports
+        # ambiguous percentages instead of clearly separating physical vs VGPIO,
+        # the tool fails its falsification requirement.
+        ("pads_identical_diffvgpio", False, True),
+        # TEST CASE 3: Physical GPIO different but VGPIO identical.
+        ("pads_diffphys_identical", True, False),
+        # TEST CASE 6: Raw DW0/DW1 register comparison catches differences
+        # that might be missed by logical field comparison. This is the
+        # "Ultimate Truth" - even if mode/direction/etc look OK, different
+        # raw values mean different hardware config.
+        ("pads_raw_register_diff", True, False),
+    ], indirect=["image_pads"])
+    def test_physical_and_vgpio_compared_separately(self, image_pads, phys_diff, vgpio_diff):
         """
-        TEST CASE 1: Both physical GPIO and VGPIO are identical.
-        
-        Expected: 100% match for both physical and VGPIO
-        This is the null case - should pass without issues.
+        Physical GPIOs and VGPIOs are compared independently: an identical
+        pad set is 100% identical with zero mismatches, a different one shows
+        mismatches and is not fully identical.
         """
-        from tools.compare_images import compare_pads_by_type, compare_pad_set
-        
-        # Combine all pads
-        all_pads_a = {**mock_physical_gpio_identical, **mock_vgpio_identical}
-        all_pads_b = {**mock_physical_gpio_identical, **mock_vgpio_identical}
-        
-        # Separate by type
-        phys_a, phys_b, vgpio_a, vgpio_b = compare_pads_by_type(all_pads_a, all_pads_b)
-        
-        # Compare
-        phys_stats = compare_pad_set(phys_a, phys_b, "image_a", "image_b")
-        vgpio_stats = compare_pad_set(vgpio_a, vgpio_b, "image_a", "image_b")
-        
-        # Assertions
-        assert phys_stats['matches'] == phys_stats['total'], \
-            "Physical GPIO should be 100% identical"
-        assert phys_stats['mismatches'] == 0, \
-            "Physical GPIO should have zero mismatches"
-        assert vgpio_stats['matches'] == vgpio_stats['total'], \
-            "VGPIO should be 100% identical"
-        assert vgpio_stats['mismatches'] == 0, \
-            "VGPIO should have zero mismatches"
-
-    def test_physical_gpio_identical_vgpio_different(self, 
-                                                      mock_physical_gpio_identical,
-                                                      mock_vgpio_identical,
-                                                      mock_vgpio_different):
-        """
-        TEST CASE 2 (CRITICAL): Physical GPIO identical but VGPIO different.
-        
-        This is the KEY FALSIFICATION TEST. If compare_images.py reports
-        ambiguous percentages instead of clearly separating physical vs VGPIO,
-        the tool fails its falsification requirement.
-        
-        Expected: 
-        - Physical GPIO: 100% match
-        - VGPIO: 0% match
-        """
-        from tools.compare_images import compare_pads_by_type, compare_pad_set
-        
-        # Combine: identical physical, different VGPIO
-        all_pads_a = {**mock_physical_gpio_identical, **mock_vgpio_identical}
-        all_pads_b = {**mock_physical_gpio_identical, **mock_vgpio_different}
-        
-        # Separate by type
-        phys_a, phys_b, vgpio_a, vgpio_b = compare_pads_by_type(all_pads_a, all_pads_b)
-        
-        # Compare
-        phys_stats = compare_pad_set(phys_a, phys_b, "image_a", "image_b")
-        vgpio_stats = compare_pad_set(vgpio_a, vgpio_b, "image_a", "image_b")
-        
-        # Critical assertions
-        assert phys_stats['matches'] == phys_stats['total'], \
-            "FALSIFICATION FAILURE: Physical GPIO should be 100% identical"
-        assert phys_stats['mismatches'] == 0, \
-            "FALSIFICATION FAILURE: Physical GPIO should have zero mismatches"
-        
-        assert vgpio_stats['mismatches'] > 0, \
-            "FALSIFICATION VERIFICATION: VGPIO should show differences"
-        # VGPIO may not be 0% if some entries match by chance, but should be partial
-        assert vgpio_stats['matches'] < vgpio_stats['total'], \
-            "FALSIFICATION VERIFICATION: VGPIO should have mismatches"
-
-    def test_physical_gpio_different_vgpio_identical(self, 
-                                                      mock_physical_gpio_identical,
-                                                      mock_physical_gpio_different,
-                                                      mock_vgpio_identical):
-        """
-        TEST CASE 3: Physical GPIO different but VGPIO identical.
-        
-        Expected:
-        - Physical GPIO: 0% match (or partial)
-        - VGPIO: 100% match
-        """
-        from tools.compare_images import compare_pads_by_type, compare_pad_set
-        
-        # Combine: different physical, identical VGPIO
-        all_pads_a = {**mock_physical_gpio_identical, **mock_vgpio_identical}
-        all_pads_b = {**mock_physical_gpio_different, **mock_vgpio_identical}
-        
+        all_pads_a, all_pads_b = image_pads
+
         # Separate by type
         phys_a, phys_b, vgpio_a, vgpio_b = compare_pads_by_type(all_pads_a, all_pads_b)
-        
+
         # Compare
-        phys_stats = compare_pad_set(phys_a, phys_b, "image_a", "image_b")
-        vgpio_stats = compare_pad_set(vgpio_a, vgpio_b, "image_a", "image_b")
-        
-        # Physical should differ
-        assert phys_stats['mismatches'] > 0, \
-            "Physical GPIO should show differences"
-        
-        # VGPIO should match
-        assert vgpio_stats['matches'] == vgpio_stats['total'], \
-            "VGPIO should be 100% identical"
-        assert vgpio_stats['mismatches'] == 0, \
-            "VGPIO should have zero mismatches"
+        for label, stats, expect_diff in (
+                ("Physical GPIO", compare_pad_set(phys_a, phys_b, "image_a", "image_b"), phys_diff),
+                ("VGPIO", compare_pad_set(vgpio_a, vgpio_b, "image_a", "image_b"), vgpio_diff)):
+            assert (stats['mismatches'] > 0) == expect_diff, \
+                f"{label} should {'show differences' if expect_diff else 'have zero mismatches'}"
+            # Some entries may match by chance, but a differing set is never 100%
+            assert (stats['matches'] < stats['total']) == expect_diff, \
+                f"{label} should {'have mismatches' if expect_diff else 'be 100% identical'}"
 
     def test_compare_pad_set_returns_statistics(self, mock_physical_gpio_identical):
         """
@@ -269,8 +258,6 @@ class TestCompareImagesFalsification:
         - total: total unique pad names
         - details: list of differences
         """
-        from tools.compare_images import compare_pad_set
-        
         stats = compare_pad_set(mock_physical_gpio_identical, 
                                mock_physical_gpio_identical,
                                "img_a", "img_b")
@@ -295,10 +282,8 @@ class TestCompareImagesFalsification:
         
         If one image is missing a pad, it should be reported as missing_a or missing_b.
         """
-        from tools.compare_images import compare_pad_set
-        
         # Create subset
-        subset = dict(list(mock_physical_gpio_identical.items())[:2])
+        subset = dict(islice(mock_physical_gpio_identical.items(), 2))
         full = mock_physical_gpio_identical
         
         stats = compare_pad_set(full, subset, "full", "subset")
@@ -309,45 +294,11 @@ class TestCompareImagesFalsification:
         assert stats['total'] == len(full), \
             "Total should be union of both sets"
 
-    def test_raw_register_comparison_catches_differences(self):
-        """
-        TEST CASE 6: Verify that raw DW0/DW1 register comparison catches 
-        differences that might be missed by logical field comparison.
-        
-        This is the "Ultimate Truth" - even if mode/direction/etc look OK,
-        different raw values mean different hardware config.
-        """
-        from tools.compare_images import compare_pad_set
-        
-        # Pad A: looks like GPIO input
-        pad_a = {
-            'GPP_B0': {
-                'name': 'GPP_B0',
-                'mode': 'GPIO',
-                'direction': 'INPUT',
-                'dw0': 0x00000200,
-                'dw1': 0x80000000,
-                'is_vgpio': False
-            }
-        }
-        
-        # Pad B: same logical config but different termination bits in raw DW1
-        pad_b = {
-            'GPP_B0': {
-                'name': 'GPP_B0',
-                'mode': 'GPIO',
-                'direction': 'INPUT',
-                'dw0': 0x00000200,
-                'dw1': 0x80001800,  # DIFFERENT termination in raw register
-                'is_vgpio': False
-            }
-        }
-        
-        stats = compare_pad_set(pad_a, pad_b, "a", "b")
-        
-        # Should detect difference
-        assert stats['mismatches'] > 0, \
-            "Should detect raw register differences even if logical fields match"
+
+@lru_cache(maxsize=None)
+def _mock_bios(variant_physical: str, variant_vgpio: str, vgpio_stride: int) -> bytes:
+    """create_mock_bios() generates each configuration once per session"""
+    return create_mock_bios(variant_physical, variant_vgpio, vgpio_stride)
 
 
 class TestMockBIOSGeneration:
@@ -355,19 +306,15 @@ class TestMockBIOSGeneration:
 
     def test_create_mock_bios_standard(self):
         """Verify standard mock BIOS is created"""
-        from tools.create_mock_bios import create_mock_bios
-        
-        bios = create_mock_bios("standard", "standard", 20)
+        bios = _mock_bios("standard", "standard", 20)
         
         assert isinstance(bios, bytes), "Should return bytes"
         assert len(bios) > 1000, "Should have reasonable size"
 
     def test_create_mock_bios_variants(self):
         """Verify different BIOS variants are created"""
-        from tools.create_mock_bios import create_mock_bios
-        
-        bios_std = create_mock_bios("standard", "standard", 20)
-        bios_var = create_mock_bios("variant_b", "variant_b", 20)
+        bios_std = _mock_bios("standard", "standard", 20)
+        bios_var = _mock_bios("variant_b", "variant_b", 20)
         
         # Variants should be different
         assert bios_std != bios_var, \
@@ -375,13 +322,19 @@ class TestMockBIOSGeneration:
 
     def test_create_mock_bios_different_strides(self):
         """Verify VGPIO stride variations work"""
-        from tools.create_mock_bios import create_mock_bios
-        
         for stride in [12, 16, 20]:
-            bios = create_mock_bios("standard", "standard", stride)
+            bios = _mock_bios("standard", "standard", stride)
             assert isinstance(bios, bytes), f"Should work with stride {stride}"
             assert len(bios) > 0, f"Should produce output for stride {stride}"
 
+    def test_create_mock_vgpio_table_unsupported_stride(self):
+        """Strides other than 12 and 16 fall back to 20 byte entries"""
+        table_20 = create_mock_vgpio_table("standard", 20)
+        assert len(table_20) == 38 * 20
+        for stride in [0, 4, 8, 24]:
+            assert create_mock_vgpio_table("standard", stride) == table_20, \
+                f"Stride {stride} should give 20 byte entries"
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v', '--tb=short'])
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: GPL-2.0-only
+
+"""
+Tests for GPIO table detection on the mock BIOS images.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.core.detector import GPIOTableDetector
+
+MOCK_IMAGES = sorted((Path(__file__).parent.parent / 'data' / 'bios_images').glob('test_*.bin'))
+
+
+def _summary(tables):
+    return [(t['offset'], t['entry_size'], t['entry_count'], t['is_vgpio']) for t in tables]
+
+
+def test_scan_files_matches_scan_file():
+    """Parallel multi-file scan must return the same tables, in input order"""
+    detector = GPIOTableDetector()
+
+    serial = [_summary(detector.scan_file(path)) for path in MOCK_IMAGES]
+    parallel = [_summary(tables) for tables in detector.scan_files(MOCK_IMAGES, workers=2)]
+
+    assert parallel == serial
+    assert all(serial), "Every mock image should contain at least one table"
+
+
+def test_scan_file_error_not_hidden_by_open_views(monkeypatch):
+    """A failing scan's own error propagates, even with views into the mapping alive"""
+    detector = GPIOTableDetector()
+
+    def failing_scan(data, min_entries=10):
+        words = np.frombuffer(data, dtype='<u4', count=4)
+        raise ValueError(f"scan failed at 0x{int(words[0]):08x}")
+
+    monkeypatch.setattr(detector, 'scan_for_tables', failing_scan)
+    with pytest.raises(ValueError, match="scan failed"):
+        detector.scan_file(MOCK_IMAGES[0])
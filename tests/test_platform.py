@@ -5,17 +5,25 @@
 Simple test to verify platform definitions and GPIO parsing.
 """
 
+import logging
+import struct
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from platforms.alderlake import AlderLakeGpioPadConfig, get_pad_name, GPIO_GROUPS
+from platforms.alderlake import (
+    AlderLakeGpioPadConfig, get_pad_name, GPIO_GROUPS, COMMUNITIES, ALL_PAD_NAMES,
+    GPIO_MODULE_PATTERNS,
+)
+
+# Step output, shown when run as a script (see main())
+logger = logging.getLogger(__name__)
 
 def test_pad_config_parsing():
     """Test GPIO pad configuration parsing"""
-    print("Testing GPIO pad configuration parsing...")
+    logger.debug("Testing GPIO pad configuration parsing...")
     
     # Example DW0/DW1 values from a typical GPIO output pad
     # GPO, output=1, PLTRST, no termination
@@ -23,26 +31,26 @@ def test_pad_config_parsing():
     dw1 = 0x80000000  # Reset = PLTRST (10b << 30)
     
     # Create test data
-    test_data = dw0.to_bytes(4, 'little') + dw1.to_bytes(4, 'little')
+    test_data = struct.pack('<II', dw0, dw1)
     
     # Parse
     config = AlderLakeGpioPadConfig(test_data)
     
-    print(f"  DW0: 0x{config.dw0:08x}")
-    print(f"  DW1: 0x{config.dw1:08x}")
-    print(f"  Mode: {config.get_pad_mode().name}")
-    print(f"  Direction: {config.get_direction().name}")
-    print(f"  Output value: {config.get_output_value()}")
-    print(f"  Reset: {config.get_reset_config().name}")
-    print(f"  Termination: {config.get_termination().name}")
+    logger.debug(f"  DW0: 0x{config.dw0:08x}")
+    logger.debug(f"  DW1: 0x{config.dw1:08x}")
+    logger.debug(f"  Mode: {config.get_pad_mode().name}")
+    logger.debug(f"  Direction: {config.get_direction().name}")
+    logger.debug(f"  Output value: {config.get_output_value()}")
+    logger.debug(f"  Reset: {config.get_reset_config().name}")
+    logger.debug(f"  Termination: {config.get_termination().name}")
     
     assert config.get_pad_mode().name == 'GPIO'
     assert config.get_output_value() == 1
-    print("  ✓ Basic parsing works\n")
+    logger.debug("  ✓ Basic parsing works\n")
 
 def test_pad_naming():
     """Test pad name generation"""
-    print("Testing pad name generation...")
+    logger.debug("Testing pad name generation...")
     
     # Test standard GPIO groups
     assert get_pad_name('GPP_B', 0) == 'GPP_B0'
@@ -53,11 +61,11 @@ def test_pad_naming():
     assert get_pad_name('VGPIO', 0) == 'VGPIO_0'
     assert get_pad_name('VGPIO_PCIE', 10) == 'VGPIO_PCIE_10'
     
-    print("  ✓ Pad naming works\n")
+    logger.debug("  ✓ Pad naming works\n")
 
 def test_gpio_groups():
     """Test GPIO group definitions"""
-    print("Testing GPIO group definitions...")
+    logger.debug("Testing GPIO group definitions...")
     
     # Check some key groups exist
     assert 'GPP_A' in GPIO_GROUPS
@@ -69,12 +77,37 @@ def test_gpio_groups():
     gpp_b = GPIO_GROUPS['GPP_B']
     assert gpp_b['community'] == 1
     assert gpp_b['pad_count'] == 24
+    assert 'GPP_B23' in ALL_PAD_NAMES and 'GPP_B24' not in ALL_PAD_NAMES
     
-    print(f"  Total GPIO groups defined: {len(GPIO_GROUPS)}")
-    print(f"  Communities: {sorted(set(g['community'] for g in GPIO_GROUPS.values()))}")
-    print("  ✓ GPIO groups defined correctly\n")
+    logger.debug(f"  Total GPIO groups defined: {len(GPIO_GROUPS)}")
+    logger.debug(f"  Communities: {list(COMMUNITIES)}")
+    logger.debug("  ✓ GPIO groups defined correctly\n")
+
+def test_module_patterns():
+    """Test the module patterns re-exported by the top-level platforms package"""
+    logger.debug("Testing GPIO module patterns...")
+
+    import platforms
+    import src.platforms.alderlake as src_alderlake
+
+    # The top-level package keeps the FSP GUIDs on top of the src patterns
+    assert GPIO_MODULE_PATTERNS == src_alderlake.GPIO_MODULE_PATTERNS + [
+        '99C2CA49-5144-41A7-9925-1262C0321238',
+        'DE23ACEE-CF55-4FB6-AA77-984AB53DE818',
+        '1A425F84-4746-4DD8-86F5-5226AC068BCE',
+    ]
+    assert platforms.GPIO_MODULE_PATTERNS is GPIO_MODULE_PATTERNS
+    # Only the public names are re-exported, not the modules used to build them
+    assert not hasattr(platforms.alderlake, 'np') and not hasattr(platforms.alderlake, 'struct')
+    for pattern in ('Gpio', 'GPIO', 'PchInit', 'PchGpio', 'SiliconInit',
+                    'GpioInit', 'PlatformGpio', 'PchSmi'):
+        assert pattern in GPIO_MODULE_PATTERNS
+
+    logger.debug("  ✓ Module patterns re-exported correctly\n")
 
 def main():
+    logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+
     print("=" * 60)
     print("bios2gpio Platform Definition Tests")
     print("=" * 60)
@@ -84,6 +117,7 @@ def main():
         test_pad_config_parsing()
         test_pad_naming()
         test_gpio_groups()
+        test_module_patterns()
         
         print("=" * 60)
         print("All tests passed! ✓")
@@ -244,8 +244,7 @@ def main():
 
         logger.info(f"Scanning {len(files_to_scan)} files...")
         all_tables = []
-        for file_path in files_to_scan:
-            tables = detector.scan_file(file_path, min_entries=args.min_entries)
+        for tables in detector.scan_files(files_to_scan, min_entries=args.min_entries):
             all_tables.extend(tables)
 
         if not all_tables:
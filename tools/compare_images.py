@@ -12,8 +12,13 @@ import argparse
 import logging
 import sys
 import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any
+from operator import itemgetter
+from typing import Dict, List, Any, NamedTuple, Union
+
+import numpy as np
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -84,85 +89,134 @@ def extract_pads_from_image(image_path: Path, platform: str) -> Dict[str, Any]:
         # cleanup handled by UEFIExtractor destructor, but explicit check helps
         pass
 
+def _register_value(value: Union[int, str]) -> int:
+    """Raw register word of a pad dict (the parser stores them as hex strings)"""
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+class PadTable(NamedTuple):
+    """Pad dicts of one image as columns, rows in the dict's order"""
+    names: np.ndarray     # object array of pad names
+    regs: np.ndarray      # uint64 (DW1 << 32) | DW0 per pad, both words in one compare
+    is_vgpio: np.ndarray  # bool per pad
+    index: Dict[str, int] # pad name -> row
+    pads: List[Dict[str, Any]]  # the original dicts, only read for reporting
+
+    @classmethod
+    def from_pads(cls, pads: Dict[str, Any]) -> 'PadTable':
+        rows = list(pads.values())
+        names = np.empty(len(pads), dtype=object)
+        names[:] = list(pads)
+        dw0 = np.array([_register_value(p['dw0']) for p in rows], dtype=np.uint64)
+        dw1 = np.array([_register_value(p['dw1']) for p in rows], dtype=np.uint64)
+        return cls(
+            names,
+            (dw1 << np.uint64(32)) | dw0,
+            np.array([p.get('is_vgpio', False) for p in rows], dtype=bool),
+            {name: row for row, name in enumerate(pads)},
+            rows,
+        )
+
+    def select(self, mask: np.ndarray) -> 'PadTable':
+        """Sub-table of the rows where mask is set"""
+        rows = np.flatnonzero(mask)
+        names = self.names[rows]
+        return PadTable(
+            names, self.regs[rows], self.is_vgpio[rows],
+            {name: row for row, name in enumerate(names)},
+            [self.pads[row] for row in rows],
+        )
+
+def _split_by_type(pads: Dict[str, Any]) -> tuple:
+    """(physical, vgpio) pads of one image, in a single pass over it"""
+    physical, vgpio = {}, {}
+    for k, v in pads.items():
+        (vgpio if v.get('is_vgpio', False) else physical)[k] = v
+    return physical, vgpio
+
 def compare_pads_by_type(pads_a: Dict[str, Any], pads_b: Dict[str, Any]) -> tuple:
     """
     Separate and compare physical GPIOs from VGPIOs.
     
     Returns: (physical_pads_a, physical_pads_b, vgpio_pads_a, vgpio_pads_b)
     """
-    physical_a = {k: v for k, v in pads_a.items() if not v.get('is_vgpio', False)}
-    physical_b = {k: v for k, v in pads_b.items() if not v.get('is_vgpio', False)}
-    vgpio_a = {k: v for k, v in pads_a.items() if v.get('is_vgpio', False)}
-    vgpio_b = {k: v for k, v in pads_b.items() if v.get('is_vgpio', False)}
+    physical_a, vgpio_a = _split_by_type(pads_a)
+    physical_b, vgpio_b = _split_by_type(pads_b)
     
     return physical_a, physical_b, vgpio_a, vgpio_b
 
-def compare_pad_set(pads_a: Dict[str, Any], pads_b: Dict[str, Any], name_a: str, name_b: str) -> Dict[str, int]:
+# Logical fields reported for differing pads. Only mode is always present,
+# the other fields depend on the pad type.
+_PAD_FIELDS = ('mode', 'direction', 'output_value', 'reset', 'termination')
+
+def _pad_diffs(pad_a: Dict[str, Any], pad_b: Dict[str, Any]) -> List[tuple]:
+    """Field differences of two pads whose raw registers differ"""
+    mode_a, dir_a, val_a, reset_a, term_a = map(pad_a.get, _PAD_FIELDS)
+    mode_b, dir_b, val_b, reset_b, term_b = map(pad_b.get, _PAD_FIELDS)
+    diffs = []
+
+    # Logical Check
+    if mode_a != mode_b:
+        diffs.append(('Mode', mode_a, mode_b))
+    elif mode_a == 'GPIO':
+        # If both GPIO, check direction/output
+        if dir_a != dir_b:
+            diffs.append(('Dir', dir_a, dir_b))
+        if val_a != val_b:
+            diffs.append(('Val', str(val_a), str(val_b)))
+
+    if reset_a != reset_b:
+        diffs.append(('Reset', reset_a, reset_b))
+
+    # If logical was same but raw diffs (e.g. termination or interrupt flags)
+    if not diffs:
+        if term_a != term_b:
+            diffs.append(('Term', term_a, term_b))
+        else:
+            diffs.append(('Raw', 'DW0/1 Diff', 'DW0/1 Diff'))
+
+    return diffs
+
+def compare_pad_set(pads_a: Union[Dict[str, Any], PadTable], pads_b: Union[Dict[str, Any], PadTable],
+                    name_a: str, name_b: str) -> Dict[str, int]:
     """
     Compare a set of pads and return statistics.
+
+    Pads are compared on their raw DW0/DW1 registers (Ultimate Truth), the
+    logical fields are decoded from them. Only pads that differ are looked
+    at field by field for the details.
     
     Returns: dict with 'matches', 'mismatches', 'missing_a', 'missing_b'
     """
-    all_keys = sorted(set(pads_a.keys()) | set(pads_b.keys()))
-    
-    matches = 0
-    mismatches = 0
-    missing_a = 0
-    missing_b = 0
-    
-    diffs_detail = []
+    table_a = pads_a if isinstance(pads_a, PadTable) else PadTable.from_pads(pads_a)
+    table_b = pads_b if isinstance(pads_b, PadTable) else PadTable.from_pads(pads_b)
 
-    for name in all_keys:
-        pad_a = pads_a.get(name)
-        pad_b = pads_b.get(name)
-
-        if not pad_a:
-            missing_a += 1
-            diffs_detail.append((name, 'MISSING_A', f'(Not in {name_a})', 'Present'))
-            continue
-        if not pad_b:
-            missing_b += 1
-            diffs_detail.append((name, 'MISSING_B', 'Present', f'(Not in {name_b})'))
-            continue
-
-        # Compare fields
-        diffs = []
-
-        # Logical Check
-        if pad_a['mode'] != pad_b['mode']:
-            diffs.append(('Mode', pad_a['mode'], pad_b['mode']))
-        elif pad_a['mode'] == 'GPIO':
-            # If both GPIO, check direction/output
-            if pad_a.get('direction') != pad_b.get('direction'):
-                diffs.append(('Dir', pad_a.get('direction'), pad_b.get('direction')))
-            if pad_a.get('output_value') != pad_b.get('output_value'):
-                diffs.append(('Val', str(pad_a.get('output_value')), str(pad_b.get('output_value'))))
-
-        if pad_a['reset'] != pad_b['reset']:
-            diffs.append(('Reset', pad_a['reset'], pad_b['reset']))
-
-        # Raw Register Check (Ultimate Truth)
-        if pad_a['dw0'] != pad_b['dw0'] or pad_a['dw1'] != pad_b['dw1']:
-            # If logical was same but raw diffs (e.g. termination or interrupt flags)
-            if not diffs:
-                if pad_a.get('termination') != pad_b.get('termination'):
-                    diffs.append(('Term', pad_a['termination'], pad_b['termination']))
-                else:
-                    diffs.append(('Raw', 'DW0/1 Diff', 'DW0/1 Diff'))
-
-        if diffs:
-            mismatches += 1
-            for field, val_a, val_b in diffs:
-                diffs_detail.append((name, field, str(val_a), str(val_b)))
-        else:
-            matches += 1
-    
+    common, ia, ib = np.intersect1d(table_a.names, table_b.names,
+                                    assume_unique=True, return_indices=True)
+    only_b = np.setdiff1d(table_b.names, table_a.names, assume_unique=True)
+    only_a = np.setdiff1d(table_a.names, table_b.names, assume_unique=True)
+
+    mism = table_a.regs[ia] != table_b.regs[ib]
+
+    diffs_detail = []
+    for name in only_b:
+        diffs_detail.append((name, 'MISSING_A', f'(Not in {name_a})', 'Present'))
+    for name in only_a:
+        diffs_detail.append((name, 'MISSING_B', 'Present', f'(Not in {name_b})'))
+    for row in np.flatnonzero(mism):
+        pad_a = table_a.pads[ia[row]]
+        pad_b = table_b.pads[ib[row]]
+        for field, val_a, val_b in _pad_diffs(pad_a, pad_b):
+            diffs_detail.append((common[row], field, str(val_a), str(val_b)))
+    # Report in pad name order, a pad's fields stay in order (stable sort)
+    diffs_detail.sort(key=itemgetter(0))
+
+    mismatches = int(mism.sum())
     return {
-        'matches': matches,
+        'matches': len(common) - mismatches,
         'mismatches': mismatches,
-        'missing_a': missing_a,
-        'missing_b': missing_b,
-        'total': len(all_keys),
+        'missing_a': len(only_b),
+        'missing_b': len(only_a),
+        'total': len(common) + len(only_a) + len(only_b),
         'details': diffs_detail
     }
 
@@ -179,10 +233,10 @@ def print_comparison_section(section_name: str, stats: Dict[str, int], name_a: s
     print(f"{'Pad Name':<20} | {'Field':<10} | {name_a[:18]:<20} | {name_b[:18]:<20}")
     print("-" * 80)
     
-    for detail in stats['details']:
-        name, field, val_a, val_b = detail
-        print(f"{name:<20} | {field:<10} | {str(val_a):<20} | {str(val_b):<20}")
-    
+    # One write for all detail rows instead of a print() per row
+    row = "{:<20} | {:<10} | {!s:<20} | {!s:<20}\n".format
+    sys.stdout.write(''.join(row(*detail) for detail in stats['details']))
+
     print("-" * 80)
     print(f"Total Pads: {stats['total']}")
     print(f"Identical:  {stats['matches']:4d} ({stats['matches']/stats['total']*100:5.1f}%)")
@@ -201,7 +255,12 @@ def compare_pads(pads_a: Dict[str, Any], pads_b: Dict[str, Any], name_a: str, na
     """
     
     # Separate physical GPIO from VGPIO
-    physical_a, physical_b, vgpio_a, vgpio_b = compare_pads_by_type(pads_a, pads_b)
+    table_a = PadTable.from_pads(pads_a)
+    table_b = PadTable.from_pads(pads_b)
+    physical_a = table_a.select(~table_a.is_vgpio)
+    physical_b = table_b.select(~table_b.is_vgpio)
+    vgpio_a = table_a.select(table_a.is_vgpio)
+    vgpio_b = table_b.select(table_b.is_vgpio)
     
     print("\n" + "="*90)
     print(f"COMPREHENSIVE GPIO COMPARISON: {name_a} vs {name_b}")
@@ -264,8 +323,11 @@ def main():
         logger.error("Input files not found.")
         return 1
 
-    pads_a = extract_pads_from_image(path_a, args.platform)
-    pads_b = extract_pads_from_image(path_b, args.platform)
+    # The two extractions are independent and CPU-bound (extraction, table
+    # scan, parsing), run them side by side
+    extract = partial(extract_pads_from_image, platform=args.platform)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        pads_a, pads_b = executor.map(extract, [path_a, path_b])
 
     if not pads_a or not pads_b:
         logger.error("Failed to extract pads from one or both images.")
@@ -9,11 +9,27 @@ the compare_images.py tool, specifically verifying that it correctly separates
 physical GPIO from VGPIO comparisons.
 """
 
-import struct
 import sys
 from pathlib import Path
 from typing import Tuple
 
+import numpy as np
+
+def _pack_entries(dw0, dw1, stride: int = 8) -> bytes:
+    """
+    Table of `stride` byte entries: little-endian DW0, DW1, then zero words.
+
+    Args:
+        dw0, dw1: Register words per entry (array-likes of equal length)
+        stride: Entry size in bytes (a multiple of 4, at least 8)
+    """
+    if stride < 8 or stride % 4:
+        raise ValueError(f"Entry stride must be a multiple of 4 of at least 8 bytes, not {stride}")
+    words = np.zeros((len(dw0), stride // 4), dtype='<u4')
+    words[:, 0] = dw0
+    words[:, 1] = dw1
+    return words.tobytes()
+
 def create_mock_gpio_table(variant: str = "standard") -> bytes:
     """
     Create a mock GPIO configuration table.
@@ -24,81 +40,39 @@ def create_mock_gpio_table(variant: str = "standard") -> bytes:
             - "variant_a": Physical GPIO table variant A
             - "variant_b": Physical GPIO table variant B (different from A)
     """
-    entries = []
-    
+    # Each entry is 8 bytes: DW0 (4 bytes) + DW1 (4 bytes)
+    # Entries 4+ pad the table to meet the minimum threshold (>100 for standard tables)
+    index = np.arange(4, 150)
+
     if variant == "standard" or variant == "variant_a":
         # Standard GPIO table - GPP_B group style configurations
-        # Each entry is 8 bytes: DW0 (4 bytes) + DW1 (4 bytes)
-        
-        # GPP_B0 - GPIO input, PLTRST, no termination
-        dw0 = 0x00000200  # RX enabled, TX disabled, mode=GPIO
-        dw1 = 0x80000000  # PLTRST reset
-        entries.append(struct.pack('<II', dw0, dw1))
-        
-        # GPP_B1 - GPIO output = 1, PLTRST
-        dw0 = 0x00000101  # TX enabled, RX disabled, output=1, mode=GPIO
-        dw1 = 0x80000000  # PLTRST reset
-        entries.append(struct.pack('<II', dw0, dw1))
-        
-        # GPP_B2 - Native function NF1, PLTRST
-        dw0 = 0x00000400  # Mode = NF1 (1 << 10)
-        dw1 = 0x80000000  # PLTRST reset
-        entries.append(struct.pack('<II', dw0, dw1))
-        
-        # GPP_B3 - GPIO input with pull-up 20K
-        dw0 = 0x00000200  # RX enabled, TX disabled
-        dw1 = 0x80001800  # PLTRST, termination = UP_20K (6 << 10)
-        entries.append(struct.pack('<II', dw0, dw1))
-        
-        # Add more entries to meet minimum threshold (>100 for standard tables)
-        for i in range(4, 150):
-            # Mix of GPIO and native functions
-            if i % 3 == 0:
-                # Native function
-                dw0 = 0x00000400  # NF1
-                dw1 = 0x80000000
-            else:
-                # GPIO input
-                dw0 = 0x00000200
-                dw1 = 0x80000000
-            entries.append(struct.pack('<II', dw0, dw1))
-    
+        head = [
+            (0x00000200, 0x80000000),  # GPP_B0 - GPIO input (RX enabled, TX disabled), PLTRST, no termination
+            (0x00000101, 0x80000000),  # GPP_B1 - GPIO output = 1 (TX enabled, RX disabled), PLTRST
+            (0x00000400, 0x80000000),  # GPP_B2 - Native function NF1 (1 << 10), PLTRST
+            (0x00000200, 0x80001800),  # GPP_B3 - GPIO input with pull-up 20K (6 << 10)
+        ]
+        # Mix of GPIO and native functions: NF1 every third entry, else GPIO input
+        tail_dw0 = np.where(index % 3 == 0, 0x00000400, 0x00000200)
+
     elif variant == "variant_b":
         # Different physical GPIO configuration - GPP_B with changes
         # CRITICAL TEST CASE: Different physical GPIO config
-        
-        # GPP_B0 - GPIO OUTPUT (different from variant_a which is INPUT)
-        dw0 = 0x00000101  # TX enabled, output=1 (DIFFERENT!)
-        dw1 = 0x80000000
-        entries.append(struct.pack('<II', dw0, dw1))
-        
-        # GPP_B1 - GPIO INPUT (different from variant_a which is OUTPUT)
-        dw0 = 0x00000200  # RX enabled (DIFFERENT!)
-        dw1 = 0x80000000
-        entries.append(struct.pack('<II', dw0, dw1))
-        
-        # GPP_B2 - Native function NF2 (different from variant_a's NF1)
-        dw0 = 0x00000800  # Mode = NF2 (DIFFERENT!)
-        dw1 = 0x80000000
-        entries.append(struct.pack('<II', dw0, dw1))
-        
-        # GPP_B3 - GPIO input without pull-up (different from variant_a's UP_20K)
-        dw0 = 0x00000200  # RX enabled, TX disabled
-        dw1 = 0x80000000  # PLTRST, no termination (DIFFERENT!)
-        entries.append(struct.pack('<II', dw0, dw1))
-        
-        # Add more entries
-        for i in range(4, 150):
-            if i % 4 == 0:
-                # Different mix
-                dw0 = 0x00000800  # NF2
-                dw1 = 0x80000000
-            else:
-                dw0 = 0x00000200
-                dw1 = 0x80000000
-            entries.append(struct.pack('<II', dw0, dw1))
-    
-    return b''.join(entries)
+        head = [
+            (0x00000101, 0x80000000),  # GPP_B0 - GPIO OUTPUT, output=1 (DIFFERENT! variant_a is INPUT)
+            (0x00000200, 0x80000000),  # GPP_B1 - GPIO INPUT (DIFFERENT! variant_a is OUTPUT)
+            (0x00000800, 0x80000000),  # GPP_B2 - Native function NF2 (DIFFERENT! variant_a is NF1)
+            (0x00000200, 0x80000000),  # GPP_B3 - GPIO input, no termination (DIFFERENT! variant_a is UP_20K)
+        ]
+        # Different mix: NF2 every fourth entry, else GPIO input
+        tail_dw0 = np.where(index % 4 == 0, 0x00000800, 0x00000200)
+
+    else:
+        return b''
+
+    dw0 = np.concatenate(([dw0 for dw0, _ in head], tail_dw0))
+    dw1 = np.concatenate(([dw1 for _, dw1 in head], np.full(len(index), 0x80000000)))
+    return _pack_entries(dw0, dw1)
 
 def create_mock_vgpio_table(variant: str = "standard", stride: int = 20) -> bytes:
     """
@@ -111,54 +85,34 @@ def create_mock_vgpio_table(variant: str = "standard", stride: int = 20) -> byte
             - "variant_b": VGPIO variant B (different from A)
         stride: Entry size in bytes (12, 16, or 20 for VGPIO testing)
     """
-    entries = []
-    
     # Create 38 entries (typical VGPIO table size)
     entry_count = 38
-    
+    # Bit 10 of DW0: 0 (GPIO) on even entries, 1 (NF1) on odd ones
+    modes = np.arange(entry_count, dtype='<u4') & 1
+
     if variant == "standard" or variant == "variant_a":
         # Standard VGPIO configuration
-        for i in range(entry_count):
-            # DW0: 
-            # Bit 31:30 = 01 (DEEP reset)
-            # Bit 27 = 1 (NAFVWE)
-            # Bit 10 = 0 (GPIO) or 1 (NF1)
-            
-            mode = 0 if i % 2 == 0 else 1
-            
-            dw0 = (1 << 30) | (1 << 27) | (mode << 10)
-            dw1 = 0x00000000
-            
-            # Create variable-length entry based on stride
-            if stride == 12:
-                entry = struct.pack('<III', dw0, dw1, 0)
-            elif stride == 16:
-                entry = struct.pack('<IIII', dw0, dw1, 0, 0)
-            else:  # stride == 20
-                entry = struct.pack('<IIIII', dw0, dw1, 0, 0, 0)
-            
-            entries.append(entry)
-    
+        dw1 = 0x00000000
+
     elif variant == "variant_b":
         # Different VGPIO configuration - critical for falsification test
         # This allows testing: "Physical GPIO identical, VGPIO different"
-        for i in range(entry_count):
-            # Different mode pattern
-            mode = 1 if i % 2 == 0 else 0  # REVERSED!
-            
-            dw0 = (1 << 30) | (1 << 27) | (mode << 10)
-            dw1 = 0x00010000  # DIFFERENT register value
-            
-            if stride == 12:
-                entry = struct.pack('<III', dw0, dw1, 0)
-            elif stride == 16:
-                entry = struct.pack('<IIII', dw0, dw1, 0, 0)
-            else:
-                entry = struct.pack('<IIIII', dw0, dw1, 0, 0, 0)
-            
-            entries.append(entry)
-    
-    return b''.join(entries)
+        modes ^= 1  # Different mode pattern, REVERSED!
+        dw1 = 0x00010000  # DIFFERENT register value
+
+    else:
+        return b''
+
+    # DW0:
+    # Bit 31:30 = 01 (DEEP reset)
+    # Bit 27 = 1 (NAFVWE)
+    # Bit 10 = mode
+    dw0 = np.uint32((1 << 30) | (1 << 27)) | (modes << 10)
+
+    # Variable-length entries based on stride, zero padded; any stride other
+    # than 12 or 16 gives 20 byte entries
+    entry_size = stride if stride in (12, 16) else 20
+    return _pack_entries(dw0, np.full(entry_count, dw1), entry_size)
 
 def create_mock_invalid_gpio_table(variant: str = "invalid_mode") -> bytes:
     """
@@ -174,25 +128,26 @@ def create_mock_invalid_gpio_table(variant: str = "invalid_mode") -> bytes:
             - "all_ones": 0xFFFFFFFF
             - "all_zeros": 0x00000000
     """
-    entries = []
-    
     if variant == "invalid_mode":
         # Generate entries with Mode = 8 (1000 binary)
         # DW0[13:10] = 1000
-        for i in range(50):
-            dw0 = (8 << 10) | (1 << 30) # Mode 8, Reset 1
-            dw1 = 0
-            entries.append(struct.pack('<II', dw0, dw1))
-            
+        dw0, dw1 = (8 << 10) | (1 << 30), 0  # Mode 8, Reset 1
+
     elif variant == "all_ones":
-        for i in range(50):
-            entries.append(struct.pack('<II', 0xFFFFFFFF, 0xFFFFFFFF))
-            
+        dw0, dw1 = 0xFFFFFFFF, 0xFFFFFFFF
+
     elif variant == "all_zeros":
-        for i in range(50):
-            entries.append(struct.pack('<II', 0, 0))
-            
-    return b''.join(entries)
+        dw0, dw1 = 0, 0
+
+    else:
+        return b''
+
+    return _pack_entries(np.full(50, dw0), np.full(50, dw1))
+
+# Fixed parts of every mock image: header (256 bytes of padding) and the
+# erased-flash padding around the VGPIO table
+_MOCK_HEADER = bytes(256)
+_MOCK_PADDING = b'\xFF' * 1024
 
 def create_mock_bios(variant_physical: str = "standard", 
                      variant_vgpio: str = "standard", 
@@ -210,23 +165,15 @@ def create_mock_bios(variant_physical: str = "standard",
     """
     
     # Create a simple binary blob
-    # Header (256 bytes of padding)
-    header = b'\x00' * 256
-    
     # Standard GPIO table (Stride 8)
     gpio_table = create_mock_gpio_table(variant_physical)
     
-    # Padding between tables
-    padding1 = b'\xFF' * 1024
-    
     # VGPIO table with specified stride
     vgpio_table = create_mock_vgpio_table(variant_vgpio, vgpio_stride)
     
-    # More padding
-    padding2 = b'\xFF' * 1024
-    
-    # Combine
-    mock_bios = header + gpio_table + padding1 + vgpio_table + padding2
+    # Combine (one allocation for the whole image): header, GPIO table,
+    # padding between tables, VGPIO table, more padding
+    mock_bios = b''.join((_MOCK_HEADER, gpio_table, _MOCK_PADDING, vgpio_table, _MOCK_PADDING))
     
     return mock_bios
 
@@ -295,8 +242,7 @@ def main():
             vgpio_stride=scenario['stride']
         )
         
-        with open(output_file, 'wb') as f:
-            f.write(mock_bios)
+        output_file.write_bytes(mock_bios)
         
         print(f"  ✓ Created: {output_file} ({len(mock_bios)} bytes)\n")
     
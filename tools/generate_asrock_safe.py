@@ -37,7 +37,10 @@ def generate_safe_config(bios_path, reference_path, output_path):
         if name.startswith('VGPIO'): return 'vGPIO'
         return 'OTHER'
 
-    sorted_names = sorted(reference.keys(), key=lambda x: (get_group(x), x))
+    # Group of every reference pad, worked out once for sorting and the configs
+    group_of = {name: get_group(name) for name in reference}
+
+    sorted_names = sorted(reference, key=lambda x: (group_of[x], x))
     
     for name in sorted_names:
         # Determine configuration
@@ -45,7 +48,7 @@ def generate_safe_config(bios_path, reference_path, output_path):
             # SAFE DEFAULT for ALL VGPIOs
             pad_config = {
                 'name': name,
-                'group': get_group(name),
+                'group': group_of[name],
                 'mode': 'GPIO',
                 'direction': 'INPUT',
                 'reset': 'DEEP',
@@ -60,7 +63,7 @@ def generate_safe_config(bios_path, reference_path, output_path):
             if name in composed_state:
                 pad_config = composed_state[name]
                 # Ensure group is set
-                pad_config['group'] = get_group(name)
+                pad_config['group'] = group_of[name]
             else:
                 logger.warning(f"Physical pad {name} missing in composition! Using reference default (risky but necessary).")
                 # Fallback to reference mode (we only know mode from reference parsing)
@@ -69,7 +72,7 @@ def generate_safe_config(bios_path, reference_path, output_path):
                 mode_str = f"NF{mode_val}" if mode_val > 0 else "GPIO"
                 pad_config = {
                     'name': name,
-                    'group': get_group(name),
+                    'group': group_of[name],
                     'mode': mode_str,
                     'reset': 'PLTRST', # Guess
                     'direction': 'INPUT' # Guess
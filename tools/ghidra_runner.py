@@ -1,80 +1,189 @@
 import os
+import hashlib
 import subprocess
 import tempfile
-import shutil
+import shlex
 import argparse
 import sys
 import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
 
+# Optional: faster decoding of Ghidra's JSON output and cached results
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Lines of Ghidra output kept to report a failed run
+OUTPUT_TAIL_LINES = 500
+
 # Default Ghidra path based on user environment
 DEFAULT_GHIDRA_HOME = "/run/media/julian/ML2/Python/coreboot/coreboot/util/bios2gpio/ghidra"
 
-def run_ghidra_analysis(input_file, ghidra_home=None, script_name="find_gpio_tables.py"):
+# Scripts that work on functions, references or decompiled code and so need
+# Ghidra's auto-analysis. Both bundled scripts do, so by default every run is
+# analysed as before; only a script left out of this set (one that just looks
+# at the raw bytes) runs with -noanalysis, skipping the slowest phase of a
+# headless run. --no-analysis / analysis=False opts in for any script.
+SCRIPTS_REQUIRING_ANALYSIS = frozenset({
+    "find_gpio_tables.py",
+    "find_gpio_mmio_loops.py",
+})
+
+# Parsed analysis results, one JSON file per (input, script) pair
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "bios2gpio" / "ghidra"
+
+def _file_sha256(path, chunk_size=1 << 20):
+    """SHA-256 hex digest of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Ghidra scripts run by this tool
+SCRIPT_DIR = Path(__file__).parent / "ghidra" / "scripts"
+
+@lru_cache(maxsize=4)
+def _resolve_headless(ghidra_home):
+    """analyzeHeadless of a Ghidra installation, None if it doesn't exist (checked once per home)"""
+    analyze_headless = Path(ghidra_home) / "support" / "analyzeHeadless"
+    return analyze_headless if analyze_headless.exists() else None
+
+@lru_cache(maxsize=16)
+def _resolve_script(script_name):
+    """Path of a script in SCRIPT_DIR, None if it doesn't exist (checked once per script)"""
+    script_path = SCRIPT_DIR / script_name
+    return script_path if script_path.exists() else None
+
+def _load_json(path):
+    """Decode a JSON file (with orjson when available)"""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def _cache_path(input_file, script_path, analysis=True, cache_dir=DEFAULT_CACHE_DIR):
+    """
+    Cache file for the results of running script_path on input_file.
+
+    Keyed on the input's content and on the script's name and mtime, so a
+    changed binary or an edited script never hits an old entry. Runs without
+    auto-analysis get their own entries.
+    """
+    parts = [_file_sha256(input_file), script_path.name, str(script_path.stat().st_mtime_ns)]
+    if not analysis:
+        parts.append("noanalysis")
+    key = hashlib.sha256("\0".join(parts).encode()).hexdigest()
+    return Path(cache_dir) / f"{key}.json"
+
+def _store_cached_results(cache_file, results):
+    """Write results to cache_file atomically (concurrent runs never see a partial file)"""
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(results, f)
+            os.replace(tmp_name, cache_file)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not cache Ghidra results: {e}")
+
+def run_ghidra_analysis(input_file, ghidra_home=None, script_name="find_gpio_tables.py",
+                        use_cache=True, force_refresh=False, analysis=None):
     """
     Runs Ghidra headless analysis on the given input file using the specified script.
     Returns parsed JSON results if available, None otherwise.
+
+    Parsed results are cached on disk (see DEFAULT_CACHE_DIR), so analysing
+    the same binary with the same script again skips Ghidra entirely.
+    use_cache=False bypasses the cache, force_refresh=True re-runs Ghidra
+    and replaces the cached entry.
+
+    analysis selects whether Ghidra's auto-analysis runs before the script:
+    None (default) runs it only for SCRIPTS_REQUIRING_ANALYSIS, which
+    currently lists every bundled script, so by default it always runs.
+    False skips it (faster, but less info for the script), True always
+    runs it.
     """
     if ghidra_home is None:
         ghidra_home = os.environ.get("GHIDRA_HOME", DEFAULT_GHIDRA_HOME)
 
-    ghidra_home_path = Path(ghidra_home)
-    analyze_headless = ghidra_home_path / "support" / "analyzeHeadless"
-
-    if not analyze_headless.exists():
-        print(f"Error: Ghidra headless executable not found at {analyze_headless}")
+    analyze_headless = _resolve_headless(str(ghidra_home))
+    if analyze_headless is None:
+        print(f"Error: Ghidra headless executable not found at {Path(ghidra_home) / 'support' / 'analyzeHeadless'}")
         return None
 
     # Script location
-    script_dir = Path(__file__).parent / "ghidra" / "scripts"
-    if not (script_dir / script_name).exists():
-        print(f"Error: Script {script_name} not found in {script_dir}")
+    script_path = _resolve_script(script_name)
+    if script_path is None:
+        print(f"Error: Script {script_name} not found in {SCRIPT_DIR}")
         return None
 
+    if analysis is None:
+        analysis = script_name in SCRIPTS_REQUIRING_ANALYSIS
+
+    cache_file = None
+    if use_cache:
+        cache_file = _cache_path(input_file, script_path, analysis)
+        if not force_refresh and cache_file.exists():
+            try:
+                results = _load_json(cache_file)
+                print(f"Using cached Ghidra results for {input_file} ({cache_file})")
+                return results
+            except Exception as e:
+                print(f"Warning: Ignoring unreadable cache entry {cache_file}: {e}")
+
     # Create a temporary directory for the Ghidra project
     with tempfile.TemporaryDirectory() as temp_dir:
         project_name = "temp_ghidra_project"
+        # Per-run output file (passed as the script's argument), so concurrent
+        # runs don't read each other's results
+        json_output_file = Path(temp_dir) / "gpio_analysis.json"
         
         cmd = [
             str(analyze_headless),
             temp_dir,
             project_name,
             "-import", str(input_file),
-            "-scriptPath", str(script_dir),
-            "-postScript", script_name,
+            "-scriptPath", str(SCRIPT_DIR),
+            "-postScript", script_name, str(json_output_file),
             "-deleteProject" # Clean up after we are done
         ]
+        if not analysis:
+            cmd.append("-noanalysis")
 
         print(f"Running Ghidra analysis on {input_file}...")
-        print(f"Command: {' '.join(cmd)}")
+        print(f"Command: {shlex.join(cmd)}")
 
         try:
-            # Run Ghidra and capture output
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=False # Don't raise exception immediately, we want to handle return codes
-            )
-            
-            # Print stdout/stderr
-            print("--- Ghidra Output ---")
-            print(result.stdout)
-            if result.stderr:
-                print("--- Ghidra Errors ---")
-                print(result.stderr)
+            # Run Ghidra and pass its output (stderr included) through as it
+            # comes, only the tail is kept for reporting a failure
+            print("--- Ghidra Output ---", flush=True)
+            tail = deque(maxlen=OUTPUT_TAIL_LINES)
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                  text=True, bufsize=1) as proc:
+                for line in proc.stdout:
+                    sys.stdout.write(line)
+                    tail.append(line)
             
-            if result.returncode != 0:
-                print(f"Ghidra analysis failed with return code {result.returncode}")
+            if proc.returncode != 0:
+                print(f"Ghidra analysis failed with return code {proc.returncode}")
+                print(f"--- Last {len(tail)} lines of Ghidra output ({input_file}) ---")
+                sys.stdout.write(''.join(tail))
                 return None
             
-            # Try to parse JSON output from /tmp/ghidra_gpio_analysis.json
-            json_output_file = Path("/tmp/ghidra_gpio_analysis.json")
+            # Try to parse the script's JSON output
             if json_output_file.exists():
                 try:
-                    with open(json_output_file, 'r') as f:
-                        results = json.load(f)
+                    results = _load_json(json_output_file)
                     print(f"\n[*] Parsed Ghidra results: {len(results.get('vgpio_usb_0_candidates', []))} VGPIO_USB_0 candidates, {len(results.get('gpio_functions', []))} GPIO functions")
+                    if cache_file is not None:
+                        _store_cached_results(cache_file, results)
                     return results
                 except Exception as e:
                     print(f"Warning: Could not parse Ghidra JSON output: {e}")
@@ -85,20 +194,62 @@ def run_ghidra_analysis(input_file, ghidra_home=None, script_name="find_gpio_tab
             print(f"An error occurred while running Ghidra: {e}")
             return None
 
+def analyze_batch(input_files, jobs=1, **kwargs):
+    """
+    Runs run_ghidra_analysis() on several input files, up to jobs at once.
+
+    Yields (input_file, result) as soon as each analysis finishes, in
+    completion order, so callers can process results while the remaining
+    files are still being analysed. kwargs are passed on to
+    run_ghidra_analysis().
+    """
+    analyze = partial(run_ghidra_analysis, **kwargs)
+
+    # Every run has its own temporary project and output file, so several
+    # binaries can be analysed side by side
+    jobs = min(jobs, len(input_files))
+    if jobs <= 1:
+        for input_file in input_files:
+            yield input_file, analyze(input_file)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(analyze, input_file): input_file for input_file in input_files}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
 def main():
     parser = argparse.ArgumentParser(description="Run Ghidra analysis for bios2gpio")
-    parser.add_argument("input_file", help="Path to the binary file (e.g., PchInitDxe.efi)")
+    parser.add_argument("input_file", nargs="+", help="Path(s) to the binary file(s) (e.g., PchInitDxe.efi)")
     parser.add_argument("--ghidra-home", help="Path to Ghidra installation root", default=DEFAULT_GHIDRA_HOME)
     parser.add_argument("--script", help="Name of the Ghidra script to run", default="find_gpio_mmio_loops.py")
+    parser.add_argument("--no-cache", action="store_true", help="Neither read nor write cached analysis results")
+    parser.add_argument("--refresh", action="store_true", help="Re-run Ghidra even if cached results exist")
+    parser.add_argument("--no-analysis", dest="analysis", action="store_false", default=None,
+                        help="Skip Ghidra's auto-analysis: much faster, but the script sees no "
+                             "functions or references (default: run it; all bundled scripts "
+                             "need it)")
+    parser.add_argument("--jobs", "-j", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="Number of Ghidra instances to run at once (each is a full JVM, default: half the CPUs)")
     
     args = parser.parse_args()
     
-    if not os.path.exists(args.input_file):
-        print(f"Error: Input file {args.input_file} does not exist.")
-        sys.exit(1)
+    for input_file in args.input_file:
+        if not os.path.exists(input_file):
+            print(f"Error: Input file {input_file} does not exist.")
+            sys.exit(1)
+
+    finished = dict(analyze_batch(args.input_file, args.jobs, ghidra_home=args.ghidra_home,
+                                  script_name=args.script, use_cache=not args.no_cache,
+                                  force_refresh=args.refresh, analysis=args.analysis))
+    results = {input_file: finished[input_file] for input_file in args.input_file}
+
+    if len(results) > 1:
+        # Combined summary: parsed results, true (no JSON output) or null (failed)
+        print("\n--- Batch Results ---")
+        print(json.dumps(results, indent=2))
 
-    success = run_ghidra_analysis(args.input_file, args.ghidra_home, args.script)
-    if not success:
+    if not all(results.values()):
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -1,61 +1,90 @@
 #!/usr/bin/env python3
-import struct
+import os
+import mmap
 import logging
 from pathlib import Path
 
+import numpy as np
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(message)s')
 logger = logging.getLogger(__name__)
 
+# Expected Patterns for VGPIO_USB_0 (NF1 | DEEP)
+# Mode NF1 = 1 << 10 = 0x400
+# Reset DEEP = 1 << 30 = 0x40000000
+# NAFVWE = 1 << 27 (usually) = 0x08000000
+PATTERNS = [
+    (0x48000400, "NF1 | DEEP | NAFVWE (Bit 27)"),
+    (0x40000480, "NF1 | DEEP | NAFVWE (Bit 7)"),
+    (0x40000400, "NF1 | DEEP (No NAFVWE)"),
+    (0x40000402, "NF1 | DEEP | RX State (Bit 1)")
+]
+
+# Offsets prefiltered per block, so the temporaries stay cache sized
+# instead of several times the image size
+SCAN_BLOCK = 1 << 20
+
+def find_pattern_hits(data, patterns):
+    """
+    Find every occurrence of the DW0 patterns in data (bytes or mmap).
+
+    Returns sorted (dw0, offset, next_dw0, next_is_nf1, next_is_gpio) tuples
+    as plain Python values, so no view into data outlives the call.
+    """
+    vals = [val for val, _ in patterns]
+    # Bits on which all patterns agree, and their common value. A single
+    # AND+CMP per dword on those bits rejects nearly the whole image (including
+    # 0xFF/0x00 padding); only the survivors are checked against the patterns.
+    agree_mask = 0xFFFFFFFF
+    for val in vals:
+        agree_mask &= ~(val ^ vals[0])
+    common_bits = vals[0] & agree_mask
+
+    # Little-endian dword at every byte offset (overlapping, zero-copy view)
+    words = np.ndarray((max(len(data) - 3, 0),), dtype='<u4', buffer=data, strides=(1,))
+    blocks = [np.empty(0, dtype=np.intp)]
+    for base in range(0, len(words), SCAN_BLOCK):
+        block = words[base:base + SCAN_BLOCK]
+        blocks.append(np.flatnonzero((block & np.uint32(agree_mask)) == common_bits) + base)
+    starts = np.concatenate(blocks)
+    starts = starts[np.isin(words[starts], vals)]
+    # Found a match, check context
+    # VGPIO table usually has 12 entries (12 * 16 bytes = 192 bytes)
+    # Check next entry (VGPIO_USB_1), skip matches without one
+    starts = starts[starts + 20 <= len(data)]
+    dw0s = words[starts]
+    next_dw0s = words[starts + 16]
+
+    # Pair filter: the next entry should be similar (NF1 or GPIO)
+    next_nf1 = (next_dw0s & 0x400) != 0
+    next_gpio = ~next_nf1 & (((next_dw0s >> 10) & 0xF) == 0)
+
+    return sorted(zip(dw0s.tolist(), starts.tolist(), next_dw0s.tolist(),
+                      next_nf1.tolist(), next_gpio.tolist()))
+
 def hunt_vgpio_usb_0(bios_path):
     logger.info(f"Hunting for VGPIO_USB_0 in {bios_path}...")
     
+    # Map the image instead of reading a private copy of it (mmap can't map
+    # an empty file, which has nothing to find anyway)
+    hits = []
     with open(bios_path, 'rb') as f:
-        data = f.read()
-    
-    # Expected Patterns for VGPIO_USB_0 (NF1 | DEEP)
-    # Mode NF1 = 1 << 10 = 0x400
-    # Reset DEEP = 1 << 30 = 0x40000000
-    # NAFVWE = 1 << 27 (usually) = 0x08000000
-    
-    patterns = [
-        (0x48000400, "NF1 | DEEP | NAFVWE (Bit 27)"),
-        (0x40000480, "NF1 | DEEP | NAFVWE (Bit 7)"),
-        (0x40000400, "NF1 | DEEP (No NAFVWE)"),
-        (0x40000402, "NF1 | DEEP | RX State (Bit 1)")
-    ]
-    
+        if os.fstat(f.fileno()).st_size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                hits = find_pattern_hits(data, PATTERNS)
+
     found = False
-    for val, desc in patterns:
-        packed = struct.pack('<I', val)
-        offset = 0
-        while True:
-            offset = data.find(packed, offset)
-            if offset == -1:
-                break
-            
-            # Found a match, check context
-            # VGPIO table usually has 12 entries (12 * 16 bytes = 192 bytes)
-            # Check if this looks like the start of a table
+    for val, desc in PATTERNS:
+        for _, offset, next_dw0, nf1, gpio in (h for h in hits if h[0] == val):
+            next_desc = "NF1" if nf1 else "GPIO" if gpio else "Unknown"
             
-            # Check next entry (VGPIO_USB_1)
-            # Should be similar (NF1 or GPIO)
-            try:
-                next_dw0 = struct.unpack('<I', data[offset+16:offset+20])[0]
-                next_desc = "Unknown"
-                if next_dw0 & 0x400: next_desc = "NF1"
-                elif (next_dw0 >> 10) & 0xF == 0: next_desc = "GPIO"
-                
-                logger.info(f"Found {desc} (0x{val:08x}) at 0x{offset:x}")
-                logger.info(f"  Next entry (+16): 0x{next_dw0:08x} ({next_desc})")
-                
-                if next_desc in ["NF1", "GPIO"]:
-                    logger.info("  -> CANDIDATE! Context looks valid.")
-                    found = True
-            except:
-                pass
+            logger.info(f"Found {desc} (0x{val:08x}) at 0x{offset:x}")
+            logger.info(f"  Next entry (+16): 0x{next_dw0:08x} ({next_desc})")
             
-            offset += 1
+            if nf1 or gpio:
+                logger.info("  -> CANDIDATE! Context looks valid.")
+                found = True
 
     if not found:
         logger.info("No exact hardcoded VGPIO_USB_0 configuration found.")
@@ -9,21 +9,36 @@ requiring full BIOS extraction (which requires ifdtool).
 """
 
 import sys
+import argparse
 from pathlib import Path
+from types import MappingProxyType
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tools.compare_images import compare_pads_by_type, compare_pad_set, print_comparison_section
 
-def test_falsification_logic():
-    """Test the critical falsification case: identical physical, different VGPIO"""
+def _frozen(pads):
+    """Read-only view of a pad dict and of each pad in it"""
+    return MappingProxyType({name: MappingProxyType(pad) for name, pad in pads.items()})
+
+def _quiet(*args, **kwargs):
+    pass
+
+def test_falsification_logic(verbose: bool = False):
+    """
+    Test the critical falsification case: identical physical, different VGPIO
+
+    Only failed checks and a one-line result are printed unless verbose is
+    set, which prints the comparison tables and every check.
+    """
+    log = print if verbose else _quiet
     
-    print("=" * 90)
-    print("INTEGRATION TEST: compare_images.py Falsification Logic")
-    print("=" * 90)
+    log("=" * 90)
+    log("INTEGRATION TEST: compare_images.py Falsification Logic")
+    log("=" * 90)
     
     # Create test data: identical physical GPIO
-    physical_gpio_a = {
+    physical_gpio_a = _frozen({
         'GPP_B0': {
             'name': 'GPP_B0', 'mode': 'GPIO', 'direction': 'INPUT',
             'output_value': 0, 'reset': 'PLTRST', 'termination': 'NONE',
@@ -34,12 +49,15 @@ def test_falsification_logic():
             'output_value': 1, 'reset': 'PLTRST', 'termination': 'NONE',
             'dw0': 0x00000101, 'dw1': 0x80000000, 'is_vgpio': False
         }
-    }
+    })
     
-    physical_gpio_b = dict(physical_gpio_a)  # Identical copy
+    # Identical: the very same pads. Sharing them is safe only because they
+    # are read-only, a comparison that modified a pad would fail loudly
+    # instead of silently changing both sides.
+    physical_gpio_b = physical_gpio_a
     
     # Create test data: different VGPIO
-    vgpio_a = {
+    vgpio_a = _frozen({
         'VGPIO0': {
             'name': 'VGPIO0', 'mode': 'GPIO', 'direction': 'INPUT',
             'reset': 'DEEP', 'dw0': 0x48000000, 'dw1': 0x00000000, 'is_vgpio': True
@@ -48,9 +66,9 @@ def test_falsification_logic():
             'name': 'VGPIO1', 'mode': 'NF1', 'direction': None,
             'reset': 'DEEP', 'dw0': 0x48000400, 'dw1': 0x00000000, 'is_vgpio': True
         }
-    }
+    })
     
-    vgpio_b = {
+    vgpio_b = _frozen({
         'VGPIO0': {
             'name': 'VGPIO0', 'mode': 'NF1', 'direction': None,
             'reset': 'DEEP', 'dw0': 0x48000400, 'dw1': 0x00010000, 'is_vgpio': True
@@ -59,14 +77,14 @@ def test_falsification_logic():
             'name': 'VGPIO1', 'mode': 'GPIO', 'direction': 'OUTPUT',
             'reset': 'DEEP', 'dw0': 0x48000000, 'dw1': 0x00010000, 'is_vgpio': True
         }
-    }
+    })
     
     # Combine all pads
     all_pads_a = {**physical_gpio_a, **vgpio_a}
     all_pads_b = {**physical_gpio_b, **vgpio_b}
     
-    print("\nTEST CASE: Identical Physical GPIO + Different VGPIO")
-    print("-" * 90)
+    log("\nTEST CASE: Identical Physical GPIO + Different VGPIO")
+    log("-" * 90)
     
     # Separate by type
     phys_a, phys_b, vgpio_a_sep, vgpio_b_sep = compare_pads_by_type(all_pads_a, all_pads_b)
@@ -76,20 +94,21 @@ def test_falsification_logic():
     vgpio_stats = compare_pad_set(vgpio_a_sep, vgpio_b_sep, "image_a.bin", "image_b.bin")
     
     # Print sections
-    print_comparison_section("PHYSICAL GPIO", phys_stats, "image_a.bin", "image_b.bin")
-    print_comparison_section("VGPIO", vgpio_stats, "image_a.bin", "image_b.bin")
+    if verbose:
+        print_comparison_section("PHYSICAL GPIO", phys_stats, "image_a.bin", "image_b.bin")
+        print_comparison_section("VGPIO", vgpio_stats, "image_a.bin", "image_b.bin")
     
     # Verification assertions
-    print("\n" + "=" * 90)
-    print("FALSIFICATION VERIFICATION RESULTS")
-    print("=" * 90)
+    log("\n" + "=" * 90)
+    log("FALSIFICATION VERIFICATION RESULTS")
+    log("=" * 90)
     
     passed = 0
     failed = 0
     
     # Check 1: Physical GPIOs should be 100% identical
     if phys_stats['matches'] == phys_stats['total'] and phys_stats['mismatches'] == 0:
-        print("✓ CHECK 1 PASSED: Physical GPIO is 100% identical")
+        log("✓ CHECK 1 PASSED: Physical GPIO is 100% identical")
         passed += 1
     else:
         print(f"✗ CHECK 1 FAILED: Physical GPIO should be 100% identical but got {phys_stats['matches']}/{phys_stats['total']}")
@@ -97,28 +116,33 @@ def test_falsification_logic():
     
     # Check 2: VGPIOs should show differences
     if vgpio_stats['mismatches'] > 0 or vgpio_stats['missing_a'] > 0 or vgpio_stats['missing_b'] > 0:
-        print("✓ CHECK 2 PASSED: VGPIO differences correctly detected")
+        log("✓ CHECK 2 PASSED: VGPIO differences correctly detected")
         passed += 1
     else:
         print("✗ CHECK 2 FAILED: VGPIO differences should be detected")
         failed += 1
     
     # Check 3: Tool output should have separate sections
-    print("✓ CHECK 3 PASSED: Tool output separated Physical GPIO from VGPIO comparison")
+    log("✓ CHECK 3 PASSED: Tool output separated Physical GPIO from VGPIO comparison")
     passed += 1
     
-    print("\n" + "=" * 90)
-    print(f"RESULT: {passed} passed, {failed} failed")
-    print("=" * 90)
+    log("\n" + "=" * 90)
+    log(f"RESULT: {passed} passed, {failed} failed")
+    log("=" * 90)
+    if not verbose:
+        print(f"falsification logic: {passed} passed, {failed} failed")
     
     if failed == 0:
-        print("\n✓✓✓ FALSIFICATION LOGIC IS CORRECT ✓✓✓")
-        print("The tool correctly separates physical GPIO from VGPIO comparisons!")
-        print("Critical requirement satisfied: Can verify if two images have identical physical GPIOs")
+        log("\n✓✓✓ FALSIFICATION LOGIC IS CORRECT ✓✓✓")
+        log("The tool correctly separates physical GPIO from VGPIO comparisons!")
+        log("Critical requirement satisfied: Can verify if two images have identical physical GPIOs")
         return 0
     else:
-        print("\n✗✗✗ FALSIFICATION LOGIC HAS ISSUES ✗✗✗")
+        log("\n✗✗✗ FALSIFICATION LOGIC HAS ISSUES ✗✗✗")
         return 1
 
 if __name__ == '__main__':
-    sys.exit(test_falsification_logic())
+    parser = argparse.ArgumentParser(description="Quick integration test of the falsification logic")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print the comparison tables and each check")
+    args = parser.parse_args()
+    sys.exit(test_falsification_logic(args.verbose))